@@ -34,7 +34,13 @@ bl_info = {
     "category": "Object",
 }
 
-import importlib
+# Reload submodules only when the package itself is re-executed (Reload Scripts during development);
+# a normal enable/startup imports them once and does not re-parse anything.
+if "_modules" in locals():
+    import importlib
+    for _m in _modules:
+        importlib.reload(_m)
+    del _m
 
 # Import submodules
 from . import utils
@@ -48,15 +54,7 @@ from . import ui
 _modules = [utils, profiles, prefs, ops_split, ops_connectors, ui]
 
 def register():
-    """Register all SnapSplit submodules (with hot-reload support during development)."""
-    # Reload modules during development to pick up edits without restarting Blender
-    for m in _modules:
-        try:
-            importlib.reload(m)
-        except Exception:
-            # On first load, reload may fail harmlessly
-            pass
-
+    """Register all SnapSplit submodules."""
     for m in _modules:
         if hasattr(m, "register"):
             m.register()
@@ -21,65 +21,115 @@ along with this program; if not, see <https://www.gnu.org/licenses>.
 
 import bpy
 import bmesh
+import functools
+import numpy as np
 from mathutils import Vector, Matrix
 from bpy.types import Operator
 from bpy_extras import view3d_utils
 
-from .utils import ensure_collection, unit_mm, report_user
+from .utils import (
+    ensure_collection,
+    obj_world_bb,
+    report_user,
+    unit_mm_cached,
+    cache_unit_mm,
+    clear_unit_mm_cache,
+)
 
 # ---------------------------
 # BBox and projection
 # ---------------------------
 
 def _bb_world(obj):
-    """Return the world-space bounding box corner coordinates of an object."""
-    return [obj.matrix_world @ Vector(c) for c in obj.bound_box]
+    """Return the world-space axis-aligned bounding box of an object as (min, max)."""
+    return obj_world_bb(obj)
 
-def _proj_interval(points, axis_dir, origin):
-    """Project points onto a direction (axis_dir) and return min/max distances from origin."""
-    a = axis_dir.normalized()
-    return (min((p - origin).dot(a) for p in points),
-            max((p - origin).dot(a) for p in points))
+def _bb_world_many(objs):
+    """Return world AABBs (min, max) for many objects at once (same result as _bb_world per object)."""
+    if not objs:
+        return []
+    bb = [o.bound_box for o in objs]
+    lmin = np.array([b[0][:] for b in bb], dtype=np.float64)
+    lmax = np.array([b[6][:] for b in bb], dtype=np.float64)
+    M = np.array([[r[:] for r in o.matrix_world] for o in objs], dtype=np.float64)
+    R = M[:, :3, :3]
+    # Center + half-extent (Arvo) for all objects in one pass
+    wc = np.einsum('nij,nj->ni', R, (lmin + lmax) * 0.5) + M[:, :3, 3]
+    we = np.einsum('nij,nj->ni', np.abs(R), (lmax - lmin) * 0.5)
+    return [(Vector(c - e), Vector(c + e)) for c, e in zip(wc, we)]
+
+# Axis lookup tables, built once (vectors are frozen: read-only, shared by all callers)
+_AXIS_IDX = {"X": 0, "Y": 1, "Z": 2}
+_AXIS_TAN_IDX = {"X": (1, 2), "Y": (0, 2), "Z": (0, 1)}
+_AXIS_VECS = {
+    "X": (Vector((1,0,0)).freeze(), Vector((0,1,0)).freeze(), Vector((0,0,1)).freeze()),
+    "Y": (Vector((0,1,0)).freeze(), Vector((1,0,0)).freeze(), Vector((0,0,1)).freeze()),
+    "Z": (Vector((0,0,1)).freeze(), Vector((1,0,0)).freeze(), Vector((0,1,0)).freeze()),
+}
+
+def _tangent_intervals(bb, axis, origin):
+    """Project an AABB (min, max) onto both seam tangents of axis; return ((t1_min, t1_max), (t2_min, t2_max))."""
+    # Tangents are world axes, so projecting is just picking the coordinate (no dot products)
+    i1, i2 = _AXIS_TAN_IDX.get(axis, (0, 1))
+    lo, hi = bb
+    return (lo[i1] - origin[i1], hi[i1] - origin[i1]), (lo[i2] - origin[i2], hi[i2] - origin[i2])
 
 def _axis_index(axis):
     """Return index 0/1/2 for X/Y/Z axis string."""
-    return {"X": 0, "Y": 1, "Z": 2}[axis]
+    return _AXIS_IDX[axis]
 
 def _axis_vectors(axis):
-    """Return normal and two tangential unit vectors for a given axis string."""
-    if axis == "X":
-        return Vector((1,0,0)), Vector((0,1,0)), Vector((0,0,1))
-    if axis == "Y":
-        return Vector((0,1,0)), Vector((1,0,0)), Vector((0,0,1))
-    return Vector((0,0,1)), Vector((1,0,0)), Vector((0,1,0))
-
-def _pair_seam_plane_pos(obj_a, obj_b, axis, props):
+    """Return normal and two tangential unit vectors for a given axis string (frozen, do not modify)."""
+    return _AXIS_VECS.get(axis, _AXIS_VECS["Z"])
+
+def _pair_seam_plane_pos(obj_a, obj_b, axis, props, bb_a=None, bb_b=None):
     """Return world-space seam plane coordinate along axis for a specific adjacent pair (A,B)."""
     idx = _axis_index(axis)
-    bb_a = _bb_world(obj_a); bb_b = _bb_world(obj_b)
-    vals_a = [c[idx] for c in bb_a]; vals_b = [c[idx] for c in bb_b]
-    lo = min(min(vals_a), min(vals_b))
-    hi = max(max(vals_a), max(vals_b))
+    if bb_a is None: bb_a = _bb_world(obj_a)
+    if bb_b is None: bb_b = _bb_world(obj_b)
+    lo = min(bb_a[0][idx], bb_b[0][idx])
+    hi = max(bb_a[1][idx], bb_b[1][idx])
     if not (lo < hi):
         return lo  # degenerate but safe
 
     mid = 0.5 * (lo + hi)
-    off_scene = float(getattr(props, "split_offset_mm", 0.0)) * unit_mm()
+    off_scene = float(getattr(props, "split_offset_mm", 0.0)) * unit_mm_cached()
     return max(lo, min(hi, mid + off_scene))
 
 # ---------------------------
 # Distribution helpers honoring seam plane
 # ---------------------------
 
-def distribute_points_line_on_seam(obj_a, obj_b, count, axis, seam_pos, margin_pct=10.0):
-    """Distribute 'count' points along the overlap line of (A,B) on the given seam plane."""
+def _samples(lo, hi, n):
+    """Return n evenly spaced values in [lo, hi] (the midpoint for n == 1)."""
+    if n <= 1:
+        return np.array([(lo + hi) * 0.5])
+    return np.linspace(lo, hi, n)
+
+def _grid_points(origin, t1n, t2n, sc, sr):
+    """Return a row-major (len(sr)*len(sc), 3) grid origin + sc*t1 + sr*t2, built in one preallocated buffer."""
+    out = np.empty((len(sr), len(sc), 3))
+    np.multiply(sc[None, :, None], t1n, out=out)
+    out += sr[:, None, None] * t2n
+    out += origin
+    return out.reshape(-1, 3)
+
+def _collapsed_seam(point, op=None):
+    """Warn (on op, if given) that a seam overlap is too small for several connectors; return the single fallback point as (1, 3)."""
+    report_user(op, 'WARNING',
+                "Seam overlap too small: placing a single connector.",
+                "Naht-Überlappung zu klein: es wird nur ein Verbinder gesetzt.")
+    return np.array([point[:]], dtype=np.float64)
+
+def distribute_points_line_on_seam(obj_a, obj_b, count, axis, seam_pos, margin_pct=10.0, bb_a=None, bb_b=None, op=None):
+    """Distribute 'count' points along the overlap line of (A,B) on the given seam plane; return an (N, 3) array."""
     n_axis, t1, t2 = _axis_vectors(axis)
-    bb_a = _bb_world(obj_a)
-    bb_b = _bb_world(obj_b)
+    if bb_a is None: bb_a = _bb_world(obj_a)
+    if bb_b is None: bb_b = _bb_world(obj_b)
 
     # Origin on seam plane (centered in tangential directions)
-    ca = sum(bb_a, Vector()) / 8.0
-    cb = sum(bb_b, Vector()) / 8.0
+    ca = (bb_a[0] + bb_a[1]) * 0.5
+    cb = (bb_b[0] + bb_b[1]) * 0.5
     origin = (ca + cb) * 0.5
     oi = _axis_index(axis)
     origin = Vector((origin.x, origin.y, origin.z))
@@ -89,53 +139,42 @@ def distribute_points_line_on_seam(obj_a, obj_b, count, axis, seam_pos, margin_p
         """Return length of 1D interval overlap."""
         return max(0.0, min(a_max, b_max) - max(a_min, b_min))
 
-    t1_min_a, t1_max_a = _proj_interval(bb_a, t1, origin)
-    t1_min_b, t1_max_b = _proj_interval(bb_b, t1, origin)
-    t2_min_a, t2_max_a = _proj_interval(bb_a, t2, origin)
-    t2_min_b, t2_max_b = _proj_interval(bb_b, t2, origin)
+    (t1_min_a, t1_max_a), (t2_min_a, t2_max_a) = _tangent_intervals(bb_a, axis, origin)
+    (t1_min_b, t1_max_b), (t2_min_b, t2_max_b) = _tangent_intervals(bb_b, axis, origin)
 
     ol1 = overlap_len(t1_min_a, t1_max_a, t1_min_b, t1_max_b)
     ol2 = overlap_len(t2_min_a, t2_max_a, t2_min_b, t2_max_b)
 
     if ol1 >= ol2:
-        t = t1.normalized()
+        t = t1
         lo = max(t1_min_a, t1_min_b)
         hi = min(t1_max_a, t1_max_b)
         span = ol1
     else:
-        t = t2.normalized()
+        t = t2
         lo = max(t2_min_a, t2_min_b)
         hi = min(t2_max_a, t2_max_b)
         span = ol2
 
     if span <= 0.0:
-        return [origin for _ in range(max(1, count))]
+        return _collapsed_seam(origin, op)
 
     m = max(0.0, float(margin_pct)) * 0.01 * span
     lo_i, hi_i = lo + m, hi - m
     if hi_i < lo_i:
         mid = (lo + hi) * 0.5
-        return [origin + t * mid for _ in range(max(1, count))]
+        return _collapsed_seam(origin + t * mid, op)
 
-    if count <= 1:
-        mid = (lo_i + hi_i) * 0.5
-        return [origin + t * mid]
+    return np.asarray(origin)[None, :] + _samples(lo_i, hi_i, count)[:, None] * np.asarray(t)[None, :]
 
-    pts = []
-    for i in range(count):
-        f = i / (count - 1)
-        s = lo_i * (1.0 - f) + hi_i * f
-        pts.append(origin + t * s)
-    return pts
-
-def distribute_points_grid_on_seam(obj_a, obj_b, cols, rows, axis, seam_pos, margin_pct=10.0):
-    """Distribute cols*rows points over the 2D overlap of (A,B) on the given seam plane."""
+def distribute_points_grid_on_seam(obj_a, obj_b, cols, rows, axis, seam_pos, margin_pct=10.0, bb_a=None, bb_b=None, op=None):
+    """Distribute cols*rows points over the 2D overlap of (A,B) on the given seam plane; return an (N, 3) array."""
     n_axis, t1, t2 = _axis_vectors(axis)
-    bb_a = _bb_world(obj_a)
-    bb_b = _bb_world(obj_b)
+    if bb_a is None: bb_a = _bb_world(obj_a)
+    if bb_b is None: bb_b = _bb_world(obj_b)
 
-    ca = sum(bb_a, Vector()) / 8.0
-    cb = sum(bb_b, Vector()) / 8.0
+    ca = (bb_a[0] + bb_a[1]) * 0.5
+    cb = (bb_b[0] + bb_b[1]) * 0.5
     origin = (ca + cb) * 0.5
     oi = _axis_index(axis)
     origin = Vector((origin.x, origin.y, origin.z))
@@ -146,129 +185,242 @@ def distribute_points_grid_on_seam(obj_a, obj_b, cols, rows, axis, seam_pos, mar
         lo = max(a_min, b_min); hi = min(a_max, b_max)
         return lo, hi, max(0.0, hi - lo)
 
-    t1_min_a, t1_max_a = _proj_interval(bb_a, t1, origin)
-    t1_min_b, t1_max_b = _proj_interval(bb_b, t1, origin)
-    t2_min_a, t2_max_a = _proj_interval(bb_a, t2, origin)
-    t2_min_b, t2_max_b = _proj_interval(bb_b, t2, origin)
+    (t1_min_a, t1_max_a), (t2_min_a, t2_max_a) = _tangent_intervals(bb_a, axis, origin)
+    (t1_min_b, t1_max_b), (t2_min_b, t2_max_b) = _tangent_intervals(bb_b, axis, origin)
 
     lo1, hi1, span1 = interval_overlap(t1_min_a, t1_max_a, t1_min_b, t1_max_b)
     lo2, hi2, span2 = interval_overlap(t2_min_a, t2_max_a, t2_min_b, t2_max_b)
 
     if span1 <= 0.0 or span2 <= 0.0:
-        return distribute_points_line_on_seam(obj_a, obj_b, cols, axis, seam_pos, margin_pct)
+        return distribute_points_line_on_seam(obj_a, obj_b, cols, axis, seam_pos, margin_pct, bb_a=bb_a, bb_b=bb_b, op=op)
 
     m1 = max(0.0, float(margin_pct)) * 0.01 * span1
     m2 = max(0.0, float(margin_pct)) * 0.01 * span2
     lo1_i, hi1_i = lo1 + m1, hi1 - m1
-    lo2_i, hi2_i = lo2 + m2, lo2 + (span2 - m2)
+    lo2_i, hi2_i = lo2 + m2, hi2 - m2
     if hi1_i < lo1_i or hi2_i < lo2_i:
-        c = origin + t1.normalized() * ((lo1 + hi1) * 0.5) + t2.normalized() * ((lo2 + hi2) * 0.5)
-        return [c for _ in range(max(1, cols * rows))]
-
-    t1n = t1.normalized(); t2n = t2.normalized()
+        return _collapsed_seam(origin + t1 * ((lo1 + hi1) * 0.5) + t2 * ((lo2 + hi2) * 0.5), op)
 
-    pts = []
-    for r in range(rows):
-        fr = r / (rows - 1) if rows > 1 else 0.5
-        sr = lo2_i * (1.0 - fr) + hi2_i * fr
-        for c in range(cols):
-            fc = c / (cols - 1) if cols > 1 else 0.5
-            sc = lo1_i * (1.0 - fc) + hi1_i * fc
-            pts.append(origin + t1n * sc + t2n * sr)
-    return pts
+    # Row-major grid, flattened to the same order as the nested loop
+    sr = _samples(lo2_i, hi2_i, rows)
+    sc = _samples(lo1_i, hi1_i, cols)
+    return _grid_points(np.asarray(origin), np.asarray(t1), np.asarray(t2), sc, sr)
 
 # ---------------------------
 # Geometry: pins / tenons
 # ---------------------------
 
-def create_cyl_pin(d_mm=5.0, length_mm=10.0, chamfer_mm=0.0, segments=32, name="SnapSplit_Pin"):
-    """Create a cylindrical pin mesh object with optional top chamfer."""
-    mm = unit_mm()
+def _mesh_from_arrays(name, co, loop_verts, loop_start):
+    """Create a mesh from vertex coordinates (V, 3), loop vertex indices and polygon loop starts via foreach_set."""
+    co = np.ascontiguousarray(co, dtype=np.float32).reshape(-1)
+    loop_verts = np.ascontiguousarray(loop_verts, dtype=np.int32).reshape(-1)
+    loop_start = np.ascontiguousarray(loop_start, dtype=np.int32).reshape(-1)
+    me = bpy.data.meshes.new(name)
+    me.vertices.add(len(co) // 3)
+    me.loops.add(len(loop_verts))
+    me.polygons.add(len(loop_start))
+    me.vertices.foreach_set("co", co)
+    me.loops.foreach_set("vertex_index", loop_verts)
+    me.polygons.foreach_set("loop_start", loop_start)
+    me.update(calc_edges=True)
+    return me
+
+@functools.lru_cache(maxsize=8)
+def _unit_cyl(n):
+    """Return (unit ring xy, loop vertex indices, polygon loop starts) of an n-segment capped cylinder (read-only)."""
+    phi = np.arange(n) * (2.0 * np.pi / n)
+    ring = np.stack((-np.sin(phi), np.cos(phi)), axis=1)
+    i = np.arange(n, dtype=np.int32)
+    j = (i + 1) % n
+    sides = np.stack((i, j, n + j, n + i), axis=1).ravel()
+    loops = np.concatenate((sides, i[::-1], n + i))
+    loop_start = np.concatenate((i * 4, (4 * n, 5 * n))).astype(np.int32)
+    for arr in (ring, loops, loop_start):
+        arr.flags.writeable = False
+    return ring, loops, loop_start
+
+def _build_cyl_pin_mesh(d_mm=5.0, length_mm=10.0, chamfer_mm=0.0, segments=32, name="SnapSplit_Pin", mm=None):
+    """Build the mesh datablock of a cylindrical pin (base at z=0) with optional top chamfer."""
+    if mm is None:
+        mm = unit_mm_cached()
     d = float(d_mm) * mm
     L = float(length_mm) * mm
     r = max(1e-9, d * 0.5)
 
-    bm = bmesh.new()
-    bmesh.ops.create_cone(
-        bm, cap_ends=True, cap_tris=False,
-        segments=max(8, int(segments)),
-        radius1=r, radius2=r, depth=L
-    )
-    # Bottom at z=0, top at z=L
-    bmesh.ops.transform(bm, matrix=Matrix.Translation((0, 0, L * 0.5)), verts=bm.verts)
-
-    # Optional top chamfer (simple approx)
+    # Same layout as bmesh create_cone (cap_ends, no cap tris): bottom ring, top ring, two n-gon caps
+    n = max(8, int(segments))
+    z_top = L
+    scale = 1.0
+    # Optional top chamfer (simple approx): shrink and lower the top ring
     if chamfer_mm and chamfer_mm > 0.0:
         chamfer = float(chamfer_mm) * mm
-        top_z = max(v.co.z for v in bm.verts)
-        top_verts = [v for v in bm.verts if abs(v.co.z - top_z) < 1e-7]
         scale = max(0.0, (r - chamfer) / r) if r > 1e-12 else 1.0
-        for v in top_verts:
-            v.co.x *= scale
-            v.co.y *= scale
-            v.co.z -= chamfer
+        z_top = L - chamfer
 
-    me = bpy.data.meshes.new(name)
-    bm.to_mesh(me); bm.free()
+    unit_ring, loops, loop_start = _unit_cyl(n)
+    ring = unit_ring * r
+    co = np.zeros((2 * n, 3), dtype=np.float32)
+    co[:n, :2] = ring
+    co[n:, :2] = ring * scale
+    co[n:, 2] = z_top
+
+    return _mesh_from_arrays(name, co, loops, loop_start)
+
+def create_cyl_pin(d_mm=5.0, length_mm=10.0, chamfer_mm=0.0, segments=32, name="SnapSplit_Pin", mm=None):
+    """Create a cylindrical pin mesh object with optional top chamfer."""
+    me = _build_cyl_pin_mesh(d_mm, length_mm, chamfer_mm, segments=segments, name=name, mm=mm)
     obj = bpy.data.objects.new(name, me)
     return obj
 
-def create_rect_tenon_quader(w_mm=6.0, length_mm=10.0, chamfer_mm=0.0, name="SnapSplit_Tenon"):
-    """Create a rectangular tenon (elongated cube) with optional bevel modifier for chamfer."""
-    mm = unit_mm()
+# Unit tenon box: xy in [-0.5, 0.5], z in [0, 1]; quads wound for outward normals
+_CUBE_CO = np.array((
+    (-0.5, -0.5, 0.0), (0.5, -0.5, 0.0), (0.5, 0.5, 0.0), (-0.5, 0.5, 0.0),
+    (-0.5, -0.5, 1.0), (0.5, -0.5, 1.0), (0.5, 0.5, 1.0), (-0.5, 0.5, 1.0),
+), dtype=np.float32)
+_CUBE_LOOPS = np.array((
+    0, 3, 2, 1,  4, 5, 6, 7,  0, 1, 5, 4,
+    1, 2, 6, 5,  2, 3, 7, 6,  3, 0, 4, 7,
+), dtype=np.int32)
+_CUBE_LOOP_START = np.arange(0, 24, 4, dtype=np.int32)
+
+def _build_rect_tenon_mesh(w_mm=6.0, length_mm=10.0, chamfer_mm=0.0, name="SnapSplit_Tenon", mm=None):
+    """Build the mesh datablock of a rectangular tenon (base at z=0) with its chamfer baked in."""
+    if mm is None:
+        mm = unit_mm_cached()
     w = float(w_mm) * mm
     L = float(length_mm) * mm
-    bm = bmesh.new()
-    bmesh.ops.create_cube(bm, size=1.0)
-    bmesh.ops.transform(bm, matrix=Matrix.Diagonal(Vector((w, w, L, 1.0))), verts=bm.verts)
     # Base at z=0, tip at z=L (analogous to pin)
-    bmesh.ops.transform(bm, matrix=Matrix.Translation((0, 0, L * 0.5)), verts=bm.verts)
-    me = bpy.data.meshes.new(name)
-    bm.to_mesh(me); bm.free()
-    obj = bpy.data.objects.new(name, me)
+    co = _CUBE_CO * np.array((w, w, L), dtype=np.float32)
+    me = _mesh_from_arrays(name, co, _CUBE_LOOPS, _CUBE_LOOP_START)
     if chamfer_mm and chamfer_mm > 0.0:
-        bev = obj.modifiers.new("Bevel", 'BEVEL')
-        bev.width = float(chamfer_mm) * mm
-        bev.segments = 1
-        bev.limit_method = 'NONE'
-    return obj
-
-def create_uv_sphere(d_mm=2.0, segments=16, rings=8, name="SnapSphere"):
-    """Create a UV sphere mesh object with given diameter and segment counts."""
-    mm = unit_mm()
+        # Same result as a 1-segment Bevel modifier on all edges, without an object or depsgraph pass
+        bm = bmesh.new()
+        bm.from_mesh(me)
+        bmesh.ops.bevel(
+            bm,
+            geom=bm.verts[:] + bm.edges[:],
+            offset=float(chamfer_mm) * mm,
+            offset_type='OFFSET',
+            segments=1,
+            profile=0.5,
+            affect='EDGES',
+            clamp_overlap=True,
+        )
+        bm.to_mesh(me)
+        bm.free()
+    return me
+
+def create_rect_tenon_quader(w_mm=6.0, length_mm=10.0, chamfer_mm=0.0, name="SnapSplit_Tenon", mm=None):
+    """Create a rectangular tenon (elongated cube) object with the chamfer baked into its mesh."""
+    return bpy.data.objects.new(name, _build_rect_tenon_mesh(w_mm, length_mm, chamfer_mm, name=name, mm=mm))
+
+def _merge_mesh_instances(src_mesh, matrices, name="SnapSplit_Merged"):
+    """Return a new mesh holding one copy of src_mesh per matrix in world space (instances must be disjoint, see _instances_overlap)."""
+    n = len(matrices)
+    nv = len(src_mesh.vertices)
+    nl = len(src_mesh.loops)
+    nf = len(src_mesh.polygons)
+
+    co = np.empty(nv * 3, dtype=np.float32)
+    src_mesh.vertices.foreach_get("co", co)
+    loop_vi = np.empty(nl, dtype=np.int32)
+    src_mesh.loops.foreach_get("vertex_index", loop_vi)
+    loop_start = np.empty(nf, dtype=np.int32)
+    src_mesh.polygons.foreach_get("loop_start", loop_start)
+
+    # All instance transforms as one (n, 4, 4) array; vertices of all copies in one pass
+    if isinstance(matrices, np.ndarray):
+        mats = matrices.astype(np.float64, copy=False)
+    else:
+        mats = np.array([[tuple(r) for r in M] for M in matrices], dtype=np.float64)
+    world = np.einsum('nij,vj->nvi', mats[:, :3, :3], co.reshape(-1, 3)) + mats[:, None, :3, 3]
+    inst = np.arange(n, dtype=np.int32)[:, None]
+
+    return _mesh_from_arrays(name, world,
+                             loop_vi[None, :] + inst * nv,
+                             loop_start[None, :] + inst * nl)
+
+def _instances_overlap(src_mesh, matrices, eps=1e-6):
+    """Return True if any two instances of src_mesh (one per (4, 4) matrix) overlap or touch (world AABB test)."""
+    n = len(matrices)
+    nv = len(src_mesh.vertices)
+    if n < 2 or not nv:
+        return False
+    co = np.empty(nv * 3, dtype=np.float32)
+    src_mesh.vertices.foreach_get("co", co)
+    co = co.reshape(-1, 3).astype(np.float64)
+    lo = co.min(axis=0)
+    hi = co.max(axis=0)
+
+    # World AABB of every instance (center + half-extent), using the largest extent for all of them.
+    # AABB overlap is necessary for mesh overlap, so the test may report round shapes that just
+    # miss each other (falls back to the slower stacked path) but never misses a real overlap.
+    mats = np.asarray(matrices, dtype=np.float64)
+    centers = np.einsum('nij,j->ni', mats[:, :3, :3], (lo + hi) * 0.5) + mats[:, :3, 3]
+    half = np.einsum('nij,j->ni', np.abs(mats[:, :3, :3]), (hi - lo) * 0.5)
+    lim = 2.0 * half.max(axis=0) + eps
+
+    # Sweep along x: the k-th sorted neighbour distance only grows with k, stop once none is near
+    s = centers[np.argsort(centers[:, 0], kind='stable')]
+    for k in range(1, n):
+        d = np.abs(s[k:] - s[:-k])
+        near = d[:, 0] < lim[0]
+        if not near.any():
+            return False
+        if np.all(d[near] < lim, axis=1).any():
+            return True
+    return False
+
+@functools.lru_cache(maxsize=4)
+def _unit_uv_sphere(nu, nv):
+    """Return (unit vertex coords, loop vertex indices, polygon loop starts) of a UV sphere (read-only)."""
+    theta = np.arange(nu) * (2.0 * np.pi / nu)
+    phi = np.arange(1, nv) * (np.pi / nv)
+    # nv - 1 rings of nu vertices from top to bottom, then the two poles
+    rings = np.stack((
+        np.outer(np.sin(phi), np.cos(theta)),
+        np.outer(np.sin(phi), np.sin(theta)),
+        np.repeat(np.cos(phi)[:, None], nu, axis=1),
+    ), axis=2).reshape(-1, 3)
+    top, bottom = len(rings), len(rings) + 1
+    co = np.concatenate((rings, ((0.0, 0.0, 1.0), (0.0, 0.0, -1.0))))
+
+    i = np.arange(nu, dtype=np.int32)
+    j = (i + 1) % nu
+    cap_top = np.stack((np.full(nu, top, dtype=np.int32), i, j), axis=1).ravel()
+    k = np.arange(nv - 2, dtype=np.int32)[:, None] * nu
+    quads = np.stack((k + i, k + nu + i, k + nu + j, k + j), axis=2).ravel()
+    last = (nv - 2) * nu
+    cap_bottom = np.stack((np.full(nu, bottom, dtype=np.int32), last + j, last + i), axis=1).ravel()
+    loops = np.concatenate((cap_top, quads, cap_bottom)).astype(np.int32)
+
+    n_quads = (nv - 2) * nu
+    loop_start = np.concatenate((
+        np.arange(nu) * 3,
+        3 * nu + np.arange(n_quads) * 4,
+        3 * nu + 4 * n_quads + np.arange(nu) * 3,
+    )).astype(np.int32)
+    for arr in (co, loops, loop_start):
+        arr.flags.writeable = False
+    return co, loops, loop_start
+
+def _build_uv_sphere_mesh(d_mm=2.0, segments=16, rings=8, name="SnapSphere", mm=None):
+    """Build the mesh datablock of a UV sphere centered at the origin (triangle fans at the poles)."""
+    if mm is None:
+        mm = unit_mm_cached()
     r = max(1e-9, float(d_mm) * 0.5 * mm)
+    co, loops, loop_start = _unit_uv_sphere(max(8, int(segments)), max(6, int(rings)))
+    return _mesh_from_arrays(name, co * r, loops, loop_start)
 
-    bm = bmesh.new()
-    bmesh.ops.create_uvsphere(
-        bm,
-        u_segments=max(8, int(segments)),
-        v_segments=max(6, int(rings)),
-        radius=r,
-        calc_uvs=False
-    )
-    me = bpy.data.meshes.new(name)
-    bm.to_mesh(me)
-    bm.free()
-    obj = bpy.data.objects.new(name, me)
-    return obj
-
-def create_uv_sphere_preview(d_mm=2.0, segments=12, rings=6, name="SnapSpherePreview"):
-    """Create a lightweight wireframe UV sphere for viewport previews."""
-    mm = unit_mm()
-    r = max(1e-9, float(d_mm) * 0.5 * mm)
+def create_uv_sphere(d_mm=2.0, segments=16, rings=8, name="SnapSphere", mm=None):
+    """Create a UV sphere mesh object with given diameter and segment counts."""
+    return bpy.data.objects.new(name, _build_uv_sphere_mesh(d_mm, segments, rings, name, mm=mm))
 
-    bm = bmesh.new()
-    bmesh.ops.create_uvsphere(
-        bm,
-        u_segments=max(8, int(segments)),
-        v_segments=max(6, int(rings)),
-        radius=r,
-        calc_uvs=False
-    )
-    me = bpy.data.meshes.new(name)
-    bm.to_mesh(me)
-    bm.free()
-    obj = bpy.data.objects.new(name, me)
+def create_uv_sphere_preview(d_mm=2.0, segments=12, rings=6, name="SnapSpherePreview", mm=None, mesh=None):
+    """Create a lightweight wireframe UV sphere for viewport previews (pass mesh to share one sphere mesh)."""
+    if mesh is None:
+        mesh = _build_uv_sphere_mesh(d_mm, segments, rings, name, mm=mm)
+    obj = bpy.data.objects.new(name, mesh)
     obj.display_type = 'WIRE'
     obj.hide_select = True
     return obj
@@ -277,28 +429,118 @@ def create_uv_sphere_preview(d_mm=2.0, segments=12, rings=6, name="SnapSpherePre
 # Boolean helpers
 # ---------------------------
 
-def boolean_apply(target_obj, mod):
-    """Apply a Boolean (or any) modifier on target_obj with validation and error handling."""
-    bpy.context.view_layer.objects.active = target_obj
-    target_obj.select_set(True)
+def _pick_solver(props):
+    """Resolve the Boolean solver for the connector settings (AUTO: FAST, EXACT only for bevelled tenons)."""
+    solver = getattr(props, "boolean_solver", "AUTO")
+    if solver != "AUTO":
+        return solver
+    ctype = getattr(props, "connector_type", "CYL_PIN")
+    if ctype not in {"CYL_PIN", "SNAP_PIN"} and float(getattr(props, "add_chamfer_mm", 0.0)) > 0.0:
+        return 'EXACT'
+    return 'FAST'
+
+def _set_boolean_solver(mod, solver=None):
+    """Set the Boolean solver from scene settings (see _pick_solver); handles the FAST -> FLOAT rename in Blender 5."""
+    if solver is None:
+        solver = _pick_solver(getattr(bpy.context.scene, "snapsplit", None))
+    try:
+        mod.solver = solver
+    except TypeError:
+        if solver == 'FAST':
+            mod.solver = 'FLOAT'
+        else:
+            raise
+
+def _apply_modifiers_via_depsgraph(target_obj, mods):
+    """Bake the evaluated mesh into target_obj without operator dispatch; return False if not applicable."""
+    # Only valid when mods are exactly the object's modifier stack (the evaluated mesh contains
+    # the whole stack) and the mesh is single-user (the operator refuses multi-user data as well).
+    if list(target_obj.modifiers) != list(mods):
+        return False
+    old_mesh = target_obj.data
+    if old_mesh is None or old_mesh.users != 1:
+        return False
     try:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        eval_obj = target_obj.evaluated_get(depsgraph)
+        new_mesh = bpy.data.meshes.new_from_object(eval_obj, preserve_all_data_layers=True, depsgraph=depsgraph)
+    except Exception:
+        return False
+    name = old_mesh.name
+    for mod in mods:
+        target_obj.modifiers.remove(mod)
+    target_obj.data = new_mesh
+    bpy.data.meshes.remove(old_mesh)
+    new_mesh.name = name
+    return True
+
+def _modifier_apply_op(obj, mod):
+    """Apply one modifier with the operator, scoped to obj via temp_override (no active/selection changes)."""
+    with bpy.context.temp_override(object=obj, active_object=obj,
+                                   selected_objects=[obj], selected_editable_objects=[obj]):
         bpy.ops.object.modifier_apply(modifier=mod.name)
-    except Exception as e:
-        report_user(None, 'WARNING', f"Modifier apply failed ({mod.name}): {e}")
-    target_obj.select_set(False)
+
+def validate_mesh(obj):
+    """Validate and update obj's mesh once after a series of Boolean applies."""
     try:
-        target_obj.data.validate(verbose=False)
-        target_obj.data.update()
+        obj.data.validate(verbose=False)
+        obj.data.update()
     except:
         pass
 
-def cut_socket_with_cutter(target_obj, cutter_obj):
+def boolean_apply(target_obj, mod, validate=False):
+    """Apply a Boolean (or any) modifier on target_obj with error handling (validate only if asked)."""
+    boolean_apply_stack(target_obj, [mod], validate=validate)
+
+def boolean_apply_stack(target_obj, mods, validate=False):
+    """Apply several modifiers on target_obj in stack order (one evaluation when possible)."""
+    if not _apply_modifiers_via_depsgraph(target_obj, mods):
+        for mod in mods:
+            try:
+                _modifier_apply_op(target_obj, mod)
+            except Exception as e:
+                report_user(None, 'WARNING', f"Modifier apply failed ({mod.name}): {e}")
+    if validate:
+        validate_mesh(target_obj)
+
+def cut_socket_with_cutter(target_obj, cutter_obj, validate=False):
     """Apply a DIFFERENCE Boolean using cutter_obj on target_obj to create a socket."""
     mod = target_obj.modifiers.new("SnapSplit_Socket", 'BOOLEAN')
     mod.operation = 'DIFFERENCE'
-    mod.solver = 'EXACT'
+    _set_boolean_solver(mod)
     mod.object = cutter_obj
-    boolean_apply(target_obj, mod)
+    boolean_apply(target_obj, mod, validate=validate)
+
+def apply_instanced_cutters(target_obj, cutters_coll, jobs, name="SnapSplit"):
+    """Apply (operation, src_mesh, (n, 4, 4) matrices) cutter jobs on target_obj in one Boolean pass; dispose the cutters."""
+    cutters = []
+    mods = []
+    for op, src_mesh, mats in jobs:
+        if mats is None or not len(mats):
+            continue
+        cut_name = f"{name}Union" if op == 'UNION' else "SnapSplit_Socket"
+        # Only disjoint instances are merged into one cutter mesh (checked on the transforms, every time)
+        if not _instances_overlap(src_mesh, mats):
+            objs = [(bpy.data.objects.new(cut_name, _merge_mesh_instances(src_mesh, mats, name=cut_name)), True)]
+        else:
+            # Overlapping instances would make a merged cutter self-intersect: one object each (shared mesh)
+            objs = []
+            for i, M in enumerate(mats):
+                o = bpy.data.objects.new(f"{cut_name}_{i}", src_mesh)
+                o.matrix_world = Matrix(M.tolist())
+                objs.append((o, False))
+        for o, _ in objs:
+            cutters_coll.objects.link(o)
+            mod = target_obj.modifiers.new(o.name, 'BOOLEAN')
+            mod.operation = op
+            _set_boolean_solver(mod)
+            mod.object = o
+            mods.append(mod)
+        cutters += objs
+    if mods:
+        boolean_apply_stack(target_obj, mods)
+    for o, remove_data in cutters:
+        _dispose_object(o, remove_data=remove_data)
 
 # ---------------------------
 # TEMP helpers: dispose temporary objects
@@ -337,23 +579,31 @@ def _dispose_object(obj, remove_data=True):
     except Exception:
         pass
 
-def cut_socket_with_cutter_and_dispose(target_obj, cutter_obj):
-    """Apply DIFFERENCE Boolean and dispose the cutter object afterwards."""
+def _remove_mesh_if_orphan(me):
+    """Remove a (shared) mesh datablock once no object uses it anymore."""
+    try:
+        if me is not None and me.users == 0:
+            bpy.data.meshes.remove(me)
+    except Exception:
+        pass
+
+def cut_socket_with_cutter_and_dispose(target_obj, cutter_obj, remove_data=True, validate=False):
+    """Apply DIFFERENCE Boolean and dispose the cutter object afterwards (keep shared data with remove_data=False)."""
     mod = target_obj.modifiers.new("SnapSplit_Socket", 'BOOLEAN')
     mod.operation = 'DIFFERENCE'
-    mod.solver = 'EXACT'
+    _set_boolean_solver(mod)
     mod.object = cutter_obj
-    boolean_apply(target_obj, mod)
-    _dispose_object(cutter_obj, remove_data=True)
+    boolean_apply(target_obj, mod, validate=validate)
+    _dispose_object(cutter_obj, remove_data=remove_data)
 
-def union_and_dispose(target_obj, union_obj, name="SnapSplit_Union"):
-    """Apply UNION Boolean and dispose the helper object afterwards."""
+def union_and_dispose(target_obj, union_obj, name="SnapSplit_Union", remove_data=True, validate=False):
+    """Apply UNION Boolean and dispose the helper object afterwards (keep shared data with remove_data=False)."""
     mod = target_obj.modifiers.new(name, 'BOOLEAN')
     mod.operation = 'UNION'
-    mod.solver = 'EXACT'
+    _set_boolean_solver(mod)
     mod.object = union_obj
-    boolean_apply(target_obj, mod)
-    _dispose_object(union_obj, remove_data=True)
+    boolean_apply(target_obj, mod, validate=validate)
+    _dispose_object(union_obj, remove_data=remove_data)
 
 # ---------------------------
 # Snap spheres helpers: shared logic
@@ -367,7 +617,7 @@ def _ring_height_for_visible_half(length_scene, embed_pct):
 def _choose_visible_half_robust(base_matrix, zA, zB):
     """Choose which local Z (A or B) protrudes in world coordinates using the frame Z-axis."""
     try:
-        z_axis_world = Vector((base_matrix[0][2], base_matrix[1][2], base_matrix[2][2])).normalized()
+        z_axis_world = Vector((base_matrix[0][2], base_matrix[1][2], base_matrix[2][2]))
         p0_w = Vector((base_matrix[0][3], base_matrix[1][3], base_matrix[2][3]))
         pA_w = base_matrix @ Vector((0.0, 0.0, zA, 1.0))
         pB_w = base_matrix @ Vector((0.0, 0.0, zB, 1.0))
@@ -377,13 +627,39 @@ def _choose_visible_half_robust(base_matrix, zA, zB):
     except Exception:
         return zB
 
+def _ring_xy(r_center, n):
+    """Return the (n, 2) local XY centers of n spheres evenly spaced on a ring of radius r_center."""
+    ang = np.arange(n) * (2.0 * np.pi / n)
+    return np.stack((r_center * np.cos(ang), r_center * np.sin(ang)), axis=1)
+
+def _build_ring_offsets(r_center, zA, zB, n):
+    """Return the local sphere offsets of a ring at heights zA and zB as two lists of (x, y, z) tuples."""
+    xy = _ring_xy(r_center, n).tolist()
+    return [(x, y, zA) for x, y in xy], [(x, y, zB) for x, y in xy]
+
+def _apply_snap_ring(base_matrix, r_center, ring_z, n, scale, sphere_mesh,
+                     name_prefix, part_a, part_b, cutters_coll):
+    """UNION a ring of n spheres (local radius r_center at height ring_z) into part_b and cut copies dilated by scale into part_a."""
+    local = np.column_stack((_ring_xy(r_center, n), np.full(n, ring_z)))
+    B = np.array([r[:] for r in base_matrix], dtype=np.float64)
+    mats = np.broadcast_to(np.eye(4), (n, 4, 4)).copy()
+    mats[:, :3, 3] = local @ B[:3, :3].T + B[:3, 3]
+    # Socket cutters differ only by their transform: the sphere dilated by the tolerance
+    mats_cut = mats.copy()
+    mats_cut[:, (0, 1, 2), (0, 1, 2)] = scale
+
+    # Each ring is fused into one cutter per part unless neighbouring (dilated) spheres overlap
+    apply_instanced_cutters(part_b, cutters_coll, [('UNION', sphere_mesh, mats)], name=f"{name_prefix}_Snap")
+    apply_instanced_cutters(part_a, cutters_coll, [('DIFFERENCE', sphere_mesh, mats_cut)], name=f"{name_prefix}_Snap")
+
 # ---------------------------
 # Sphere-placement helpers (for cylindrical Pins)
 # ---------------------------
 
-def add_snap_spheres_for_cyl_pin(base_matrix, pin_radius_scene, length_scene, props, name_prefix, part_a, part_b, cutters_coll):
+def add_snap_spheres_for_cyl_pin(base_matrix, pin_radius_scene, length_scene, props, name_prefix, part_a, part_b, cutters_coll, validate=True, sphere_mesh=None, mm=None):
     """Add a ring of snap spheres around a cylindrical pin; union to B, socket to A, and dispose helpers."""
-    mm = unit_mm()
+    if mm is None:
+        mm = unit_mm_cached()
     n_per_side = max(1, int(getattr(props, "snap_spheres_per_side", 2)))
     d_sph_mm = float(getattr(props, "snap_sphere_diameter_mm", 2.0))
     protrude_scene = float(getattr(props, "snap_sphere_protrusion_mm", 1.0)) * mm
@@ -393,50 +669,34 @@ def add_snap_spheres_for_cyl_pin(base_matrix, pin_radius_scene, length_scene, pr
     zB = _ring_height_for_visible_half(length_scene, embed_pct)
     ring_z = _choose_visible_half_robust(base_matrix, zA, zB)
 
-    import math
-    created = []
     sph_r_scene = 0.5 * float(d_sph_mm) * mm
     r_center = pin_radius_scene + protrude_scene - sph_r_scene
-
-    for i in range(n_per_side):
-        ang = (2.0 * math.pi) * (i / n_per_side)
-        nx = math.cos(ang); ny = math.sin(ang)
-
-        local_pos = Vector((r_center * nx, r_center * ny, ring_z))
-        world_pos = base_matrix @ Vector((local_pos.x, local_pos.y, local_pos.z, 1.0))
-        world_pos = Vector((world_pos.x, world_pos.y, world_pos.z))
-
-        sphere = create_uv_sphere(d_mm=d_sph_mm, segments=24, rings=12, name=f"{name_prefix}_Snap_{i}")
-        M = Matrix.Translation(world_pos)
-        sphere.matrix_world = M
-        cutters_coll.objects.link(sphere)
-
-        # Important: duplicate cutter first, then union+dispose, then difference+dispose
-        tol = float(props.effective_tolerance())
-        scale = 1.0 + (tol * mm) / max(sph_r_scene, 1e-9)
-
-        sph_cut = sphere.copy()
-        sph_cut.data = sphere.data.copy()
-        sph_cut.name = f"{name_prefix}_SnapC_{i}"
-        cutters_coll.objects.link(sph_cut)
-        sph_cut.matrix_world = M @ Matrix.Diagonal(Vector((scale, scale, scale, 1.0)))
-
-        # UNION into part B, then dispose original
-        union_and_dispose(part_b, sphere, name=f"{name_prefix}_SnapU_{i}")
-
-        # DIFFERENCE into part A, then dispose cutter
-        cut_socket_with_cutter_and_dispose(part_a, sph_cut)
-
-        created.append(None)
+    # Socket cutters are the spheres dilated by the tolerance (same for the whole ring)
+    tol = float(props.effective_tolerance())
+    scale = 1.0 + (tol * mm) / max(sph_r_scene, 1e-9)
+
+    own_mesh = sphere_mesh is None
+    if own_mesh:
+        sphere_mesh = _build_uv_sphere_mesh(d_sph_mm, 24, 12, name=f"{name_prefix}_Snap", mm=mm)
+
+    _apply_snap_ring(base_matrix, r_center, ring_z, n_per_side, scale, sphere_mesh,
+                     name_prefix, part_a, part_b, cutters_coll)
+    created = [None] * n_per_side
+    if own_mesh:
+        _remove_mesh_if_orphan(sphere_mesh)
+    if validate:
+        validate_mesh(part_a)
+        validate_mesh(part_b)
     return created
 
 # ---------------------------
 # Sphere-placement helpers (for rectangular Tenon-as-Quader; ring like pin)
 # ---------------------------
 
-def add_snap_spheres_for_rect_tenon_ring(base_matrix, half_w_scene, length_scene, props, name_prefix, part_a, part_b, cutters_coll):
+def add_snap_spheres_for_rect_tenon_ring(base_matrix, half_w_scene, length_scene, props, name_prefix, part_a, part_b, cutters_coll, validate=True, sphere_mesh=None, mm=None):
     """Add a ring of snap spheres around a square-section tenon; union to B, socket to A, and dispose helpers."""
-    mm = unit_mm()
+    if mm is None:
+        mm = unit_mm_cached()
     n_per_side = max(1, int(getattr(props, "snap_spheres_per_side", 2)))
     d_sph_mm = float(getattr(props, "snap_sphere_diameter_mm", 2.0))
     protrude_scene = float(getattr(props, "snap_sphere_protrusion_mm", 1.0)) * mm
@@ -448,80 +708,71 @@ def add_snap_spheres_for_rect_tenon_ring(base_matrix, half_w_scene, length_scene
 
     sph_r_scene = 0.5 * float(d_sph_mm) * mm
     r_center = half_w_scene + protrude_scene - sph_r_scene
-
-    import math
-    created = []
-    for i in range(n_per_side):
-        ang = (2.0 * math.pi) * (i / n_per_side)
-        nx = math.cos(ang); ny = math.sin(ang)
-
-        local_pos = Vector((r_center * nx, r_center * ny, ring_z))
-        world_pos = base_matrix @ Vector((local_pos.x, local_pos.y, local_pos.z, 1.0))
-        world_pos = Vector((world_pos.x, world_pos.y, world_pos.z))
-
-        sphere = create_uv_sphere(d_mm=d_sph_mm, segments=24, rings=12, name=f"{name_prefix}_Snap_{i}")
-        M = Matrix.Translation(world_pos)
-        sphere.matrix_world = M
-        cutters_coll.objects.link(sphere)
-
-        # Duplicate cutter first
-        tol = float(props.effective_tolerance())
-        scale = 1.0 + (tol * mm) / max(sph_r_scene, 1e-9)
-
-        sph_cut = sphere.copy()
-        sph_cut.data = sphere.data.copy()
-        sph_cut.name = f"{name_prefix}_SnapC_{i}"
-        cutters_coll.objects.link(sph_cut)
-        sph_cut.matrix_world = M @ Matrix.Diagonal(Vector((scale, scale, scale, 1.0)))
-
-        # UNION into B, then dispose original
-        union_and_dispose(part_b, sphere, name=f"{name_prefix}_SnapU_{i}")
-
-        # DIFFERENCE into A, then dispose cutter
-        cut_socket_with_cutter_and_dispose(part_a, sph_cut)
-
-        created.append(None)
+    # Socket cutters are the spheres dilated by the tolerance (same for the whole ring)
+    tol = float(props.effective_tolerance())
+    scale = 1.0 + (tol * mm) / max(sph_r_scene, 1e-9)
+
+    own_mesh = sphere_mesh is None
+    if own_mesh:
+        sphere_mesh = _build_uv_sphere_mesh(d_sph_mm, 24, 12, name=f"{name_prefix}_Snap", mm=mm)
+
+    _apply_snap_ring(base_matrix, r_center, ring_z, n_per_side, scale, sphere_mesh,
+                     name_prefix, part_a, part_b, cutters_coll)
+    created = [None] * n_per_side
+    if own_mesh:
+        _remove_mesh_if_orphan(sphere_mesh)
+    if validate:
+        validate_mesh(part_a)
+        validate_mesh(part_b)
     return created
 
 # ---------------------------
 # Single-placement helpers (click)
 # ---------------------------
 
+# Seed x-axes for frame construction (alternate when z is (anti)parallel to world X)
+_X_STD = Vector((1, 0, 0)).freeze()
+_X_ALT = Vector((0, 1, 0)).freeze()
+
 def _orthonormal_frame_from_z(z: Vector):
     """Build a stable orthonormal frame (x,y,z) from a given z-axis."""
     z = z.normalized()
-    x = Vector((1, 0, 0))
-    if abs(z.dot(x)) > 0.99:
-        x = Vector((0, 1, 0))
+    x = _X_ALT if abs(z.x) > 0.99 else _X_STD
     y = z.cross(x); y.normalize()
     x = y.cross(z); x.normalize()
     return x, y, z
 
+# Connector frames for the pristine axis normals (same result as _orthonormal_frame_from_z, computed once)
+_AXIS_FRAMES = {
+    k: tuple(v.freeze() for v in _orthonormal_frame_from_z(vecs[0]))
+    for k, vecs in _AXIS_VECS.items()
+}
+
+def _frame_matrix(x, y, z, origin=None):
+    """Return a 4x4 matrix with basis columns x, y, z and translation origin (None = no translation)."""
+    return Matrix.LocRotScale(origin, Matrix((x, y, z)).transposed(), None)
+
 def place_one_cyl_pin_at(a, b, axis, point_world, frame_z=None, props=None, name_prefix="Pin_Click"):
     """Place one cylindrical pin at a world point; union into B and cut socket into A."""
     if props is None:
         props = bpy.context.scene.snapsplit
-    z = {"X": Vector((1,0,0)), "Y": Vector((0,1,0)), "Z": Vector((0,0,1))}[axis].normalized()
-    if frame_z is not None:
-        z = frame_z.normalized()
-    x, y, z = _orthonormal_frame_from_z(z)
+    if frame_z is None:
+        x, y, z = _AXIS_FRAMES[axis]
+    else:
+        x, y, z = _orthonormal_frame_from_z(frame_z)
 
-    L_scene = float(props.pin_length_mm) * unit_mm()
+    mm = unit_mm_cached()
+    L_scene = float(props.pin_length_mm) * mm
     embed_pct = float(getattr(props, "pin_embed_pct", 50.0)) * 0.01
     p_embed = point_world - z * (embed_pct * L_scene)
 
-    M = Matrix((
-        (x.x, y.x, z.x, p_embed.x),
-        (x.y, y.y, z.y, p_embed.y),
-        (x.z, y.z, z.z, p_embed.z),
-        (0,   0,   0,   1.0),
-    ))
+    M = _frame_matrix(x, y, z, p_embed)
 
     seg = int(getattr(props, "pin_segments", 32))
     cutters_coll = ensure_collection("_SnapSplit_Cutters")
 
     pin = create_cyl_pin(props.pin_diameter_mm, props.pin_length_mm, props.add_chamfer_mm,
-                         segments=seg, name=f"{name_prefix}")
+                         segments=seg, name=f"{name_prefix}", mm=mm)
     pin.matrix_world = M
     cutters_coll.objects.link(pin)
 
@@ -531,10 +782,12 @@ def place_one_cyl_pin_at(a, b, axis, point_world, frame_z=None, props=None, name
     # DIFFERENCE (socket) into A and dispose cutter
     tol = float(props.effective_tolerance())
     socket_d = float(props.pin_diameter_mm) + 2.0 * tol
-    socket = create_cyl_pin(socket_d, props.pin_length_mm, 0.0, segments=seg, name=f"{name_prefix}_SocketCutter")
+    socket = create_cyl_pin(socket_d, props.pin_length_mm, 0.0, segments=seg, name=f"{name_prefix}_SocketCutter", mm=mm)
     socket.matrix_world = M
     cutters_coll.objects.link(socket)
     cut_socket_with_cutter_and_dispose(a, socket)
+    validate_mesh(a)
+    validate_mesh(b)
 
     return None, None
 
@@ -542,54 +795,37 @@ def place_one_rect_tenon_at(a, b, axis, point_world, frame_z=None, props=None, n
     """Place one rectangular tenon at a world point; union into B and cut socket into A."""
     if props is None:
         props = bpy.context.scene.snapsplit
-    z = {"X": Vector((1,0,0)), "Y": Vector((0,1,0)), "Z": Vector((0,0,1))}[axis].normalized()
-    if frame_z is not None:
-        z = frame_z.normalized()
-    x, y, z = _orthonormal_frame_from_z(z)
+    if frame_z is None:
+        x, y, z = _AXIS_FRAMES[axis]
+    else:
+        x, y, z = _orthonormal_frame_from_z(frame_z)
 
-    L_scene = float(props.tenon_depth_mm) * unit_mm()
+    mm = unit_mm_cached()
+    L_scene = float(props.tenon_depth_mm) * mm
     embed_pct = float(getattr(props, "pin_embed_pct", 50.0)) * 0.01
     p_embed = point_world - z * (embed_pct * L_scene)
 
-    M = Matrix((
-        (x.x, y.x, z.x, p_embed.x),
-        (x.y, y.y, z.y, p_embed.y),
-        (x.z, y.z, z.z, p_embed.z),
-        (0,   0,   0,   1.0),
-    ))
+    M = _frame_matrix(x, y, z, p_embed)
 
     cutters_coll = ensure_collection("_SnapSplit_Cutters")
 
-    tenon = create_rect_tenon_quader(props.tenon_width_mm, props.tenon_depth_mm, props.add_chamfer_mm, name=f"{name_prefix}")
+    tenon = create_rect_tenon_quader(props.tenon_width_mm, props.tenon_depth_mm, props.add_chamfer_mm,
+                                     name=f"{name_prefix}", mm=mm)
     tenon.matrix_world = M
     cutters_coll.objects.link(tenon)
 
-    # Apply bevel if present (visual chamfer)
-    for mod in list(tenon.modifiers):
-        if mod.type == 'BEVEL':
-            bpy.context.view_layer.objects.active = tenon
-            tenon.select_set(True)
-            try:
-                bpy.ops.object.modifier_apply(modifier=mod.name)
-            except Exception as e:
-                report_user(None, 'WARNING', f"Bevel apply failure: {e}")
-            tenon.select_set(False)
-
     # UNION into B and dispose tenon
     union_and_dispose(b, tenon, name=f"{name_prefix}_Union")
 
-    # DIFFERENCE (socket) into A with XY tolerance scale, dispose cutter
-    mm = unit_mm()
+    # DIFFERENCE (socket) into A, built at the dilated width (tolerance per side), dispose cutter
     tol = float(props.effective_tolerance())
-    half_w = max(0.5 * float(props.tenon_width_mm) * mm, 1e-9)
-    sx = 1.0 + (tol * mm) / half_w
-    sy = sx
-    sz = 1.0
-
-    socket = create_rect_tenon_quader(props.tenon_width_mm, props.tenon_depth_mm, 0.0, name=f"{name_prefix}_SocketCutter")
-    socket.matrix_world = M @ Matrix.Diagonal(Vector((sx, sy, sz, 1.0)))
+    socket_w = float(props.tenon_width_mm) + 2.0 * tol
+    socket = create_rect_tenon_quader(socket_w, props.tenon_depth_mm, 0.0, name=f"{name_prefix}_SocketCutter", mm=mm)
+    socket.matrix_world = M
     cutters_coll.objects.link(socket)
     cut_socket_with_cutter_and_dispose(a, socket)
+    validate_mesh(a)
+    validate_mesh(b)
 
     return None, None
 
@@ -597,8 +833,8 @@ def place_one_rect_tenon_at(a, b, axis, point_world, frame_z=None, props=None, n
 # Placement & connect (pairwise seam plane)
 # ---------------------------
 
-def place_connectors_between(parts, axis, count, ctype, props):
-    """Place connectors between adjacent parts along axis using LINE or GRID distribution."""
+def place_connectors_between(parts, axis, count, ctype, props, op=None):
+    """Place connectors between adjacent parts along axis using LINE or GRID distribution (warnings go to op, if given)."""
     if not parts:
         return []
 
@@ -611,147 +847,149 @@ def place_connectors_between(parts, axis, count, ctype, props):
     created = []
     cutters_coll = ensure_collection("_SnapSplit_Cutters")
 
-    naxis = {"X": Vector((1, 0, 0)), "Y": Vector((0, 1, 0)), "Z": Vector((0, 0, 1))}[axis]
+    mm = unit_mm_cached()
+
+    # Read all settings once (RNA access is not free); only locals are used below
     tol = float(props.effective_tolerance())
     embed_pct = float(getattr(props, "pin_embed_pct", 50.0)) * 0.01
     margin_pct = float(getattr(props, "connector_margin_pct", 10.0))
     cols = max(1, int(getattr(props, "connectors_per_seam", count)))
+    use_grid = getattr(props, "connector_distribution", "LINE") == "GRID"
+    rows = max(1, int(getattr(props, "connectors_rows", 2)))
+    ctype_cur = getattr(props, "connector_type", "CYL_PIN")
+    pin_d = float(props.pin_diameter_mm)
+    pin_L = float(props.pin_length_mm)
+    seg = int(getattr(props, "pin_segments", 32))
+    tenon_w = float(props.tenon_width_mm)
+    tenon_depth = float(props.tenon_depth_mm)
+    chamfer = float(props.add_chamfer_mm)
+
+    # World AABBs of all parts in one batched pass, valid for this call only
+    bb_cache = {o.as_pointer(): bb for o, bb in zip(ordered, _bb_world_many(ordered))}
+    def bbw(o):
+        return bb_cache[o.as_pointer()]
+
+    # Build each cutter mesh once; per part all connectors are merged from these templates
+    is_pin = ctype_cur in {"CYL_PIN", "SNAP_PIN"}
+    shared_meshes = []
+    if is_pin:
+        socket_d = pin_d + 2.0 * tol
+        pin_mesh = _build_cyl_pin_mesh(pin_d, pin_L, chamfer, segments=seg, name="Pin", mm=mm)
+        socket_mesh = _build_cyl_pin_mesh(socket_d, pin_L, 0.0, segments=seg, name="SocketCutter", mm=mm)
+        shared_meshes += [pin_mesh, socket_mesh]
+        L_scene = pin_L * mm
+        pin_radius_scene = 0.5 * pin_d * mm
+    else:
+        # RECT_TENON, SNAP_TENON and unknown types (fallback -> behave like tenon)
+        tenon_mesh = _build_rect_tenon_mesh(tenon_w, tenon_depth, chamfer, name="Tenon", mm=mm)
+        socket_mesh = _build_rect_tenon_mesh(tenon_w + 2.0 * tol, tenon_depth, 0.0,
+                                             name="TenonSocketCutter", mm=mm)
+        shared_meshes += [tenon_mesh, socket_mesh]
+        L_scene = tenon_depth * mm
+        half_w = max(0.5 * tenon_w * mm, 1e-9)
+    # Snap spheres all share one sphere mesh (the tolerance only scales the cutter object)
+    sphere_mesh = None
+    if ctype_cur in {"SNAP_PIN", "SNAP_TENON"}:
+        sphere_mesh = _build_uv_sphere_mesh(float(getattr(props, "snap_sphere_diameter_mm", 2.0)),
+                                            24, 12, name="SnapSphere", mm=mm)
+        shared_meshes.append(sphere_mesh)
+
+    # Connector frame and embed offset depend only on axis and props, not on the pair
+    x, y, z = _AXIS_FRAMES[axis]
+    embed_np = np.array(z * (embed_pct * L_scene), dtype=np.float64)
+    rot_np = np.array([r[:] for r in _frame_matrix(x, y, z, None)], dtype=np.float64)
+
+    conn_mesh = pin_mesh if is_pin else tenon_mesh
+    conn_name = "Pin" if is_pin else "Tenon"
 
-    for a, b in pairs:
-        seam_pos = _pair_seam_plane_pos(a, b, axis, props)
-
-        if getattr(props, "connector_distribution", "LINE") == "GRID":
-            rows = max(1, int(getattr(props, "connectors_rows", 2)))
-            points = distribute_points_grid_on_seam(a, b, cols, rows, axis, seam_pos, margin_pct=margin_pct)
-        else:
-            points = distribute_points_line_on_seam(a, b, cols, axis, seam_pos, margin_pct=margin_pct)
-
-        for i, p in enumerate(points):
-            z = naxis.normalized()
-            x = Vector((1, 0, 0))
-            if abs(z.dot(x)) > 0.99:
-                x = Vector((0, 1, 0))
-            y = z.cross(x); y.normalize()
-            x = y.cross(z); x.normalize()
-
-            ctype_cur = getattr(props, "connector_type", "CYL_PIN")
-            if ctype_cur in {"CYL_PIN", "SNAP_PIN"}:
-                L_scene = float(props.pin_length_mm) * unit_mm()
+    try:
+        # Pass 1: connector transforms per pair, collected per target part. A part is B (UNION) of
+        # its left seam and A (DIFFERENCE) of its right seam; both are applied together in pass 2.
+        union_mats = {}
+        socket_mats = {}
+        snap_jobs = []
+        for a, b in pairs:
+            bb_a = bbw(a); bb_b = bbw(b)
+            seam_pos = _pair_seam_plane_pos(a, b, axis, props, bb_a=bb_a, bb_b=bb_b)
+
+            if use_grid:
+                points = distribute_points_grid_on_seam(a, b, cols, rows, axis, seam_pos, margin_pct=margin_pct,
+                                                        bb_a=bb_a, bb_b=bb_b, op=op)
             else:
-                L_scene = float(props.tenon_depth_mm) * unit_mm()
-
-            p_embed = p - z * (embed_pct * L_scene)
-
-            M = Matrix((
-                (x.x, y.x, z.x, p_embed.x),
-                (x.y, y.y, z.y, p_embed.y),
-                (x.z, y.z, z.z, p_embed.z),
-                (0,   0,   0,   1.0),
-            ))
-
-            if ctype_cur in {"CYL_PIN", "SNAP_PIN"}:
-                seg = int(getattr(props, "pin_segments", 32))
-                pin = create_cyl_pin(props.pin_diameter_mm, props.pin_length_mm, props.add_chamfer_mm,
-                                     segments=seg, name=f"Pin_{i}")
-                pin.matrix_world = M
-                cutters_coll.objects.link(pin)
-
-                # UNION into B and dispose
-                union_and_dispose(b, pin, name=f"PinUnion_{i}")
-
-                # DIFFERENCE (socket) into A and dispose
-                mm = unit_mm()
-                socket_d = float(props.pin_diameter_mm) + 2.0 * tol
-                socket = create_cyl_pin(socket_d, props.pin_length_mm, 0.0, segments=seg, name=f"SocketCutter_{i}")
-                socket.matrix_world = M
-                cutters_coll.objects.link(socket)
-                cut_socket_with_cutter_and_dispose(a, socket)
-
-                created.append(None)
-
-                # Snap spheres for snap pin
+                points = distribute_points_line_on_seam(a, b, cols, axis, seam_pos, margin_pct=margin_pct,
+                                                        bb_a=bb_a, bb_b=bb_b, op=op)
+
+            if not len(points):
+                continue
+
+            # Zero-width sample ranges can repeat points; drop exact repeats (closer connectors are
+            # handled by the overlap check before merging)
+            _, first = np.unique(np.round(points, 9), axis=0, return_index=True)
+            pts = points[np.sort(first)]
+            created.extend([None] * len(pts))
+
+            # All connector transforms of the pair as one (n, 4, 4) array
+            pin_mats = np.broadcast_to(rot_np, (len(pts), 4, 4)).copy()
+            pin_mats[:, :3, 3] = pts - embed_np
+
+            union_mats.setdefault(b.as_pointer(), []).append(pin_mats)
+            socket_mats.setdefault(a.as_pointer(), []).append(pin_mats)
+            snap_jobs.append((a, b, pin_mats))
+
+        # Pass 2: one merged union cutter and one merged socket cutter per part, applied in one evaluation.
+        # apply_instanced_cutters checks the part's whole fused operand (connectors of every seam touching
+        # it) for overlaps, since neighbouring seams can overlap at a shared edge.
+        for part in ordered:
+            k = part.as_pointer()
+            jobs = []
+            for op, src_mesh, mats in (('UNION', conn_mesh, union_mats.get(k)),
+                                       ('DIFFERENCE', socket_mesh, socket_mats.get(k))):
+                if mats:
+                    jobs.append((op, src_mesh, np.concatenate(mats)))
+            if jobs:
+                apply_instanced_cutters(part, cutters_coll, jobs, name=conn_name)
+
+        # Snap spheres (per connector)
+        for a, b, pin_mats in snap_jobs:
+            if ctype_cur not in {"SNAP_PIN", "SNAP_TENON"}:
+                break
+            for i, M_np in enumerate(pin_mats):
+                M = Matrix(M_np.tolist())
                 if ctype_cur == "SNAP_PIN":
-                    pin_radius_scene = 0.5 * float(props.pin_diameter_mm) * mm
-                    length_scene = float(props.pin_length_mm) * mm
                     add_snap_spheres_for_cyl_pin(
                         base_matrix=M,
                         pin_radius_scene=pin_radius_scene,
-                        length_scene=length_scene,
+                        length_scene=L_scene,
                         props=props,
                         name_prefix=f"Pin_{i}",
                         part_a=a,  # A = DIFFERENCE
                         part_b=b,  # B = UNION
-                        cutters_coll=cutters_coll
+                        cutters_coll=cutters_coll,
+                        validate=False,
+                        sphere_mesh=sphere_mesh,
+                        mm=mm
                     )
-
-            elif ctype_cur in {"RECT_TENON", "SNAP_TENON"}:
-                tenon = create_rect_tenon_quader(props.tenon_width_mm, props.tenon_depth_mm, props.add_chamfer_mm,
-                                                 name=f"Tenon_{i}")
-                tenon.matrix_world = M
-                cutters_coll.objects.link(tenon)
-
-                # Apply bevel if present
-                for mod in list(tenon.modifiers):
-                    if mod.type == 'BEVEL':
-                        bpy.context.view_layer.objects.active = tenon
-                        tenon.select_set(True)
-                        try:
-                            bpy.ops.object.modifier_apply(modifier=mod.name)
-                        except Exception as e:
-                            report_user(None, 'WARNING', f"Bevel apply failure: {e}")
-                        tenon.select_set(False)
-
-                # UNION into B and dispose
-                union_and_dispose(b, tenon, name=f"TenonUnion_{i}")
-
-                # DIFFERENCE (socket) into A with XY tolerance scale, dispose
-                mm = unit_mm()
-                half_w = max(0.5 * float(props.tenon_width_mm) * mm, 1e-9)
-                sx = 1.0 + (tol * mm) / half_w
-                sy = sx
-                sz = 1.0
-                socket = create_rect_tenon_quader(props.tenon_width_mm, props.tenon_depth_mm, 0.0,
-                                                  name=f"TenonSocketCutter_{i}")
-                socket.matrix_world = M @ Matrix.Diagonal(Vector((sx, sy, sz, 1.0)))
-                cutters_coll.objects.link(socket)
-                cut_socket_with_cutter_and_dispose(a, socket)
-
-                created.append(None)
-
-                # Snap spheres for snap tenon
-                if ctype_cur == "SNAP_TENON":
-                    half_w_scene = max(0.5 * float(props.tenon_width_mm) * mm, 1e-9)
-                    length_scene = float(props.tenon_depth_mm) * mm
+                elif ctype_cur == "SNAP_TENON":
                     add_snap_spheres_for_rect_tenon_ring(
                         base_matrix=M,
-                        half_w_scene=half_w_scene,
-                        length_scene=length_scene,
+                        half_w_scene=half_w,
+                        length_scene=L_scene,
                         props=props,
                         name_prefix=f"Tenon_{i}",
                         part_a=a,  # A = DIFFERENCE
                         part_b=b,  # B = UNION
-                        cutters_coll=cutters_coll
+                        cutters_coll=cutters_coll,
+                        validate=False,
+                        sphere_mesh=sphere_mesh,
+                        mm=mm
                     )
-            else:
-                # Fallback -> behave like tenon
-                tenon = create_rect_tenon_quader(props.tenon_width_mm, props.tenon_depth_mm, props.add_chamfer_mm,
-                                                 name=f"Tenon_{i}")
-                tenon.matrix_world = M
-                cutters_coll.objects.link(tenon)
-                union_and_dispose(b, tenon, name=f"TenonUnion_{i}")
-
-                mm = unit_mm()
-                half_w = max(0.5 * float(props.tenon_width_mm) * mm, 1e-9)
-                sx = 1.0 + (tol * mm) / half_w
-                sy = sx
-                sz = 1.0
-                socket = create_rect_tenon_quader(props.tenon_width_mm, props.tenon_depth_mm, 0.0,
-                                                  name=f"TenonSocketCutter_{i}")
-                socket.matrix_world = M @ Matrix.Diagonal(Vector((sx, sy, sz, 1.0)))
-                cutters_coll.objects.link(socket)
-                cut_socket_with_cutter_and_dispose(a, socket)
-
-                created.append(None)
+
+        # Validate each touched part once, after all of its Booleans
+        for part in ordered:
+            validate_mesh(part)
+    finally:
+        for me in shared_meshes:
+            _remove_mesh_if_orphan(me)
 
     return created
 
@@ -777,25 +1015,43 @@ class SNAP_OT_place_connectors_click(Operator):
         self.a, self.b = sel
         self.axis = props.split_axis
         self.props = props
+        mm = cache_unit_mm()
 
         try:
+            # Parts do not move while the operator runs: the seam plane position is computed once
             self.seam_pos = _pair_seam_plane_pos(self.a, self.b, self.axis, props)
         except Exception:
+            # finish() will not run: drop the unit snapshot taken above
+            clear_unit_mm_cache()
             report_user(self, 'ERROR', "Could not compute seam plane.", "Naht-Ebene konnte nicht berechnet werden.")
             return {'CANCELLED'}
 
+        # Seam plane (axis index + seam_pos) and connector frame are constant for the whole modal session
+        self._axis_idx = _axis_index(self.axis)
+
+        x, y, z = _AXIS_FRAMES[self.axis]
+        self._frame_rot = _frame_matrix(x, y, z, None)
+        # Connector type is fixed for the modal session (read once, reused by modal)
+        self._ctype = ctype_cur = getattr(props, "connector_type", "CYL_PIN")
+        if ctype_cur in {"CYL_PIN", "SNAP_PIN"}:
+            L_scene = float(props.pin_length_mm) * mm
+        else:
+            L_scene = float(props.tenon_depth_mm) * mm
+        embed_pct = float(getattr(props, "pin_embed_pct", 50.0)) * 0.01
+        self._embed_vec = z * (embed_pct * L_scene)
+
         # Preview object (wireframe) based on connector type
         try:
-            ctype_cur = getattr(props, "connector_type", "CYL_PIN")
             prev_coll = ensure_collection("_SnapSplit_Preview")
 
             self.preview_objs = []  # multiple preview objects for SNAP_PIN/SNAP_TENON
+            sphere_meta = []  # (object, local offset A, local offset B) per snap-sphere preview
             self.preview_obj = None
 
             if ctype_cur in {"CYL_PIN", "SNAP_PIN"}:
                 seg = int(getattr(props, "pin_segments", 32))
                 pin_prev = create_cyl_pin(props.pin_diameter_mm, props.pin_length_mm, props.add_chamfer_mm,
-                                          segments=seg, name="SnapSplit_Preview_Conn")
+                                          segments=seg, name="SnapSplit_Preview_Conn", mm=mm)
                 pin_prev.display_type = 'WIRE'
                 pin_prev.hide_select = True
                 prev_coll.objects.link(pin_prev)
@@ -803,39 +1059,12 @@ class SNAP_OT_place_connectors_click(Operator):
                 self.preview_objs.append(pin_prev)
 
                 if ctype_cur == "SNAP_PIN":
-                    mm = unit_mm()
-                    n_per_side = max(1, int(getattr(props, "snap_spheres_per_side", 2)))
-                    d_sph_mm = float(getattr(props, "snap_sphere_diameter_mm", 2.0))
-                    protr_scene = float(getattr(props, "snap_sphere_protrusion_mm", 1.0)) * mm
-                    pin_radius_scene = 0.5 * float(props.pin_diameter_mm) * mm
-                    length_scene = float(props.pin_length_mm) * mm
-
-                    embed_pct = max(0.0, min(1.0, float(getattr(props, "pin_embed_pct", 50.0)) * 0.01))
-                    L_free = max(0.0, (1.0 - embed_pct) * length_scene)
-                    zA = 0.5 * embed_pct * length_scene
-                    zB = embed_pct * length_scene + 0.5 * L_free
-
-                    sph_r_scene = 0.5 * d_sph_mm * mm
-                    r_center = pin_radius_scene + protr_scene - sph_r_scene
-
-                    import math
-                    for i in range(n_per_side):
-                        ang = (2.0 * math.pi) * (i / n_per_side)
-                        nx = math.cos(ang); ny = math.sin(ang)
-
-                        local_A = (r_center * nx, r_center * ny, zA)
-                        local_B = (r_center * nx, r_center * ny, zB)
-
-                        sph_prev = create_uv_sphere_preview(d_mm=d_sph_mm, segments=12, rings=6,
-                                                            name=f"SnapSplit_Preview_Snap_{i}")
-                        sph_prev["_snapsplit_local_offset_A"] = local_A
-                        sph_prev["_snapsplit_local_offset_B"] = local_B
-                        prev_coll.objects.link(sph_prev)
-                        self.preview_objs.append(sph_prev)
+                    sphere_meta = self._build_snap_preview(props, 0.5 * float(props.pin_diameter_mm) * mm,
+                                                           float(props.pin_length_mm) * mm, "Snap", prev_coll, mm)
             else:
                 # Rectangular tenon preview
                 ten_prev = create_rect_tenon_quader(props.tenon_width_mm, props.tenon_depth_mm, props.add_chamfer_mm,
-                                                    name="SnapSplit_Preview_Conn")
+                                                    name="SnapSplit_Preview_Conn", mm=mm)
                 ten_prev.display_type = 'WIRE'
                 ten_prev.hide_select = True
                 prev_coll.objects.link(ten_prev)
@@ -844,118 +1073,90 @@ class SNAP_OT_place_connectors_click(Operator):
 
                 if ctype_cur == "SNAP_TENON":
                     # Preview spheres as a ring around the square cross-section (like pin)
-                    mm = unit_mm()
-                    n_per_side = max(1, int(getattr(props, "snap_spheres_per_side", 2)))
-                    d_sph_mm = float(getattr(props, "snap_sphere_diameter_mm", 2.0))
-                    protr_scene = float(getattr(props, "snap_sphere_protrusion_mm", 1.0)) * mm
-
-                    half_w_scene = 0.5 * float(props.tenon_width_mm) * mm
-                    length_scene = float(props.tenon_depth_mm) * mm
-
-                    embed_pct = max(0.0, min(1.0, float(getattr(props, "pin_embed_pct", 50.0)) * 0.01))
-                    L_free = max(0.0, (1.0 - embed_pct) * length_scene)
-                    zA = 0.5 * embed_pct * length_scene
-                    zB = embed_pct * length_scene + 0.5 * L_free
-
-                    sph_r_scene = 0.5 * d_sph_mm * mm
-                    r_center = half_w_scene + protr_scene - sph_r_scene
-
-                    import math
-                    for i in range(n_per_side):
-                        ang = (2.0 * math.pi) * (i / n_per_side)
-                        nx = math.cos(ang); ny = math.sin(ang)
-
-                        local_A = (r_center * nx, r_center * ny, zA)
-                        local_B = (r_center * nx, r_center * ny, zB)
-
-                        sph_prev = create_uv_sphere_preview(d_mm=d_sph_mm, segments=12, rings=6,
-                                                            name=f"SnapSplit_Preview_SnapTen_{i}")
-                        sph_prev["_snapsplit_local_offset_A"] = local_A
-                        sph_prev["_snapsplit_local_offset_B"] = local_B
-                        prev_coll.objects.link(sph_prev)
-                        self.preview_objs.append(sph_prev)
+                    sphere_meta = self._build_snap_preview(props, 0.5 * float(props.tenon_width_mm) * mm,
+                                                           float(props.tenon_depth_mm) * mm, "SnapTen", prev_coll, mm)
 
         except Exception:
             self.preview_obj = None
             self.preview_objs = []
+            sphere_meta = []
+
+        # Snap-sphere preview offsets kept on the operator (no ID-property round trip) as homogeneous
+        # (N, 4) arrays, transformed in one batch per MOUSEMOVE
+        self._snap_prev_objs = [o for o, _, _ in sphere_meta]
+        self._offsets_A = np.array([(*oa, 1.0) for _, oa, _ in sphere_meta], dtype=np.float64).reshape(-1, 4)
+        self._offsets_B = np.array([(*ob, 1.0) for _, _, ob in sphere_meta], dtype=np.float64).reshape(-1, 4)
+
+        # Last handled mouse position (MOUSEMOVE without a pixel change is skipped)
+        self._last_mx = self._last_my = -10**9
 
         context.window_manager.modal_handler_add(self)
         return {'RUNNING_MODAL'}
 
     def finish(self, context, cancelled=False):
-        """Tear down preview objects and optionally report cancellation."""
+        """Tear down preview objects (and their now unused meshes) and optionally report cancellation."""
+        prev_meshes = set()
         try:
-            if getattr(self, "preview_obj", None) and self.preview_obj.name in bpy.data.objects:
-                for coll in list(self.preview_obj.users_collection):
-                    coll.objects.unlink(self.preview_obj)
-                bpy.data.objects.remove(self.preview_obj)
-
-            if getattr(self, "preview_objs", None):
-                for o in list(self.preview_objs):
-                    if o and o.name in bpy.data.objects:
-                        for coll in list(o.users_collection):
-                            try: coll.objects.unlink(o)
-                            except Exception: pass
+            prev_meshes = {o.data for o in getattr(self, "preview_objs", None) or ()
+                           if o and o.name in bpy.data.objects and o.type == 'MESH'}
+            # Collect valid preview objects (pop from the end, no snapshot copy),
+            # unlink them and remove all in one batch_remove pass
+            to_remove = []
+            prev = getattr(self, "preview_obj", None)
+            if prev and prev.name in bpy.data.objects:
+                to_remove.append(prev)
+            objs = getattr(self, "preview_objs", None)
+            while objs:
+                o = objs.pop()
+                if o and o is not prev and o.name in bpy.data.objects:
+                    to_remove.append(o)
+            for o in to_remove:
+                # list(): unlink mutates users_collection
+                for coll in list(o.users_collection):
+                    try: coll.objects.unlink(o)
+                    except Exception: pass
+            if to_remove:
+                try:
+                    bpy.data.batch_remove(ids=to_remove)
+                except Exception:
+                    for o in to_remove:
                         try: bpy.data.objects.remove(o)
                         except Exception: pass
-                self.preview_objs.clear()
         except Exception:
             pass
+        for me in prev_meshes:
+            _remove_mesh_if_orphan(me)
 
+        clear_unit_mm_cache()
         if cancelled:
             report_user(self, 'INFO', "Placement cancelled.", "Platzierung abgebrochen.")
 
     def modal(self, context, event):
         """Handle mouse movement for preview updates and left-click for placement."""
+        # Mouse move (hot path): update preview transforms; failures only skip this update
+        if event.type == 'MOUSEMOVE':
+            mx, my = event.mouse_region_x, event.mouse_region_y
+            if mx == self._last_mx and my == self._last_my:
+                return {'RUNNING_MODAL'}
+            self._last_mx, self._last_my = mx, my
+            try:
+                self._update_preview(context, event)
+            except Exception:
+                pass
+            return {'RUNNING_MODAL'}
+
         try:
             # Cancel
             if event.type in {'ESC', 'RIGHTMOUSE'} and event.value == 'PRESS':
                 self.finish(context, cancelled=True)
                 return {'CANCELLED'}
 
-            # Mouse move: Update preview transforms
-            if event.type == 'MOUSEMOVE':
-                try:
-                    hit = self._intersect_mouse_with_seam_plane(context, event)
-                    if hit is not None:
-                        M = self._build_frame_at(hit)
-                        if self.preview_obj:
-                            self.preview_obj.matrix_world = M
-                        # SNAP_PIN / SNAP_TENON previews
-                        if getattr(self, "preview_objs", None) and len(self.preview_objs) > 1:
-                            try:
-                                z_axis_world = Vector((M[0][2], M[1][2], M[2][2])).normalized()
-                            except Exception:
-                                z_axis_world = None
-                            for o in self.preview_objs:
-                                if o is self.preview_obj:
-                                    continue
-                                try:
-                                    if "_snapsplit_local_offset_B" in o:
-                                        # Choose A/B offsets robustly (SNAP_PIN, SNAP_TENON)
-                                        oxA, oyA, ozA = o.get("_snapsplit_local_offset_A", (0.0, 0.0, 0.0))
-                                        oxB, oyB, ozB = o.get("_snapsplit_local_offset_B", (0.0, 0.0, 0.0))
-                                        if z_axis_world is not None:
-                                            pA_w_v = (M @ Vector((oxA, oyA, ozA, 1.0)))
-                                            pB_w_v = (M @ Vector((oxB, oyB, ozB, 1.0)))
-                                            dA = Vector((pA_w_v.x, pA_w_v.y, pA_w_v.z)).dot(z_axis_world)
-                                            dB = Vector((pB_w_v.x, pB_w_v.y, pB_w_v.z)).dot(z_axis_world)
-                                            use_B = dB >= dA
-                                        else:
-                                            use_B = True
-                                        o.matrix_world = M @ Matrix.Translation((oxB, oyB, ozB)) if use_B else M @ Matrix.Translation((oxA, oyA, ozA))
-                                except Exception:
-                                    pass
-                except Exception:
-                    pass
-                return {'RUNNING_MODAL'}
-
             # Left click: place connector
             if event.type == 'LEFTMOUSE' and event.value == 'PRESS':
                 try:
                     hit = self._intersect_mouse_with_seam_plane(context, event)
                     if hit is not None:
-                        ctype_cur = getattr(self.props, "connector_type", "CYL_PIN")
+                        ctype_cur = self._ctype
                         if ctype_cur == "CYL_PIN":
                             place_one_cyl_pin_at(self.a, self.b, self.axis, hit, props=self.props, name_prefix="Pin_Click")
                         elif ctype_cur == "RECT_TENON":
@@ -964,7 +1165,7 @@ class SNAP_OT_place_connectors_click(Operator):
                             # Pin + spheres (spheres added using the same frame)
                             place_one_cyl_pin_at(self.a, self.b, self.axis, hit, props=self.props, name_prefix="Pin_Click")
                             M = self._build_frame_at(hit)
-                            mm = unit_mm()
+                            mm = unit_mm_cached()
                             pin_radius_scene = 0.5 * float(self.props.pin_diameter_mm) * mm
                             length_scene = float(self.props.pin_length_mm) * mm
                             cutters_coll = ensure_collection("_SnapSplit_Cutters")
@@ -976,12 +1177,13 @@ class SNAP_OT_place_connectors_click(Operator):
                                 name_prefix="Pin_Click",
                                 part_a=self.a,  # A = DIFFERENCE
                                 part_b=self.b,  # B = UNION
-                                cutters_coll=cutters_coll
+                                cutters_coll=cutters_coll,
+                                mm=mm
                             )
                         elif ctype_cur == "SNAP_TENON":
                             place_one_rect_tenon_at(self.a, self.b, self.axis, hit, props=self.props, name_prefix="Tenon_Click")
                             M = self._build_frame_at(hit)
-                            mm = unit_mm()
+                            mm = unit_mm_cached()
                             half_w_scene = 0.5 * float(self.props.tenon_width_mm) * mm
                             length_scene = float(self.props.tenon_depth_mm) * mm
                             cutters_coll = ensure_collection("_SnapSplit_Cutters")
@@ -993,7 +1195,8 @@ class SNAP_OT_place_connectors_click(Operator):
                                 name_prefix="Tenon_Click",
                                 part_a=self.a,  # A = DIFFERENCE
                                 part_b=self.b,  # B = UNION
-                                cutters_coll=cutters_coll
+                                cutters_coll=cutters_coll,
+                                mm=mm
                             )
                 except Exception as e:
                     report_user(self, 'ERROR', f"Placement failed: {e}",
@@ -1007,60 +1210,79 @@ class SNAP_OT_place_connectors_click(Operator):
             report_user(self, 'ERROR', f"Modal error: {e}", "Modal-Fehler.")
             return {'RUNNING_MODAL'}
 
+    def _update_preview(self, context, event):
+        """Move the preview connector (and snap-sphere ring) to the seam-plane point under the mouse."""
+        hit = self._intersect_mouse_with_seam_plane(context, event)
+        if hit is None:
+            return
+        M = self._build_frame_at(hit)
+        if self.preview_obj:
+            self.preview_obj.matrix_world = M
+        # SNAP_PIN / SNAP_TENON previews: all A/B offsets in one matmul, pick the protruding half
+        objs = getattr(self, "_snap_prev_objs", None)
+        if objs:
+            M_np = np.array([r[:] for r in M], dtype=np.float64)
+            z_axis_world = M_np[:3, 2]
+            wA = self._offsets_A @ M_np.T
+            wB = self._offsets_B @ M_np.T
+            use_B = (wB[:, :3] @ z_axis_world) >= (wA[:, :3] @ z_axis_world)
+            # Offsets are pure translations: same rotation as M, only column 3 differs
+            world = np.where(use_B[:, None], wB[:, :3], wA[:, :3]).tolist()
+            for o, p in zip(objs, world):
+                mw = M.copy()
+                mw.translation = p
+                o.matrix_world = mw
+
+    def _build_snap_preview(self, props, inner_r_scene, length_scene, name_tag, prev_coll, mm):
+        """Create the wireframe snap-sphere ring preview around a connector of radius / half-width inner_r_scene."""
+        n_per_side = max(1, int(getattr(props, "snap_spheres_per_side", 2)))
+        d_sph_mm = float(getattr(props, "snap_sphere_diameter_mm", 2.0))
+        protr_scene = float(getattr(props, "snap_sphere_protrusion_mm", 1.0)) * mm
+
+        embed_pct = max(0.0, min(1.0, float(getattr(props, "pin_embed_pct", 50.0)) * 0.01))
+        zA = 0.5 * embed_pct * length_scene
+        zB = _ring_height_for_visible_half(length_scene, embed_pct)
+
+        sph_r_scene = 0.5 * d_sph_mm * mm
+        r_center = inner_r_scene + protr_scene - sph_r_scene
+
+        sphere_meta = []
+        # One wireframe sphere mesh shared by the whole ring
+        sph_mesh = _build_uv_sphere_mesh(d_sph_mm, 12, 6, name=f"SnapSplit_Preview_{name_tag}", mm=mm)
+        offs_A, offs_B = _build_ring_offsets(r_center, zA, zB, n_per_side)
+        for i, (local_A, local_B) in enumerate(zip(offs_A, offs_B)):
+            sph_prev = create_uv_sphere_preview(name=f"SnapSplit_Preview_{name_tag}_{i}", mesh=sph_mesh)
+            sphere_meta.append((sph_prev, local_A, local_B))
+            prev_coll.objects.link(sph_prev)
+            self.preview_objs.append(sph_prev)
+        return sphere_meta
+
     def _intersect_mouse_with_seam_plane(self, context, event):
         """Raycast from mouse into the seam plane and return the hit point in world space."""
-        n = {"X": Vector((1,0,0)), "Y": Vector((0,1,0)), "Z": Vector((0,0,1))}[self.axis].normalized()
-
-        ca = sum([self.a.matrix_world @ Vector(c) for c in self.a.bound_box], Vector()) / 8.0
-        cb = sum([self.b.matrix_world @ Vector(c) for c in self.b.bound_box], Vector()) / 8.0
-        c = 0.5 * (ca + cb)
-        idx = _axis_index(self.axis)
-        c[idx] = self.seam_pos
-        plane_point = c
-        plane_normal = n
-
         region = context.region
         rv3d = context.region_data
         if not rv3d:
             return None
         mx, my = event.mouse_region_x, event.mouse_region_y
         ray_origin = view3d_utils.region_2d_to_origin_3d(region, rv3d, (mx, my))
-        view_vec = rv3d.view_rotation @ Vector((0.0, 0.0, -1.0))
-        ray_target = view3d_utils.region_2d_to_location_3d(region, rv3d, (mx, my), view_vec)
-        ray_dir = (ray_target - ray_origin).normalized()
+        # Unit view direction through the pixel (perspective and orthographic)
+        ray_dir = view3d_utils.region_2d_to_vector_3d(region, rv3d, (mx, my))
 
-        denom = ray_dir.dot(plane_normal)
+        # The seam plane normal is a world axis: both dot products reduce to one coordinate
+        i = self._axis_idx
+        denom = ray_dir[i]
         if abs(denom) < 1e-8:
             return None
-        t = (plane_point - ray_origin).dot(plane_normal) / denom
+        t = (self.seam_pos - ray_origin[i]) / denom
         if t < 0:
             return None
         return ray_origin + ray_dir * t
 
     def _build_frame_at(self, point_world):
         """Build a local placement frame (Matrix) at a world point based on axis and embed depth."""
-        z = {"X": Vector((1,0,0)), "Y": Vector((0,1,0)), "Z": Vector((0,0,1))}[self.axis].normalized()
-        x = Vector((1,0,0))
-        if abs(z.dot(x)) > 0.99:
-            x = Vector((0,1,0))
-        y = z.cross(x); y.normalize()
-        x = y.cross(z); x.normalize()
-
-        ctype_cur = getattr(self.props, "connector_type", "CYL_PIN")
-        if ctype_cur in {"CYL_PIN", "SNAP_PIN"}:
-            L_scene = float(self.props.pin_length_mm) * unit_mm()
-        else:
-            L_scene = float(self.props.tenon_depth_mm) * unit_mm()
-
-        embed_pct = float(getattr(self.props, "pin_embed_pct", 50.0)) * 0.01
-        p_embed = point_world - z * (embed_pct * L_scene)
-
-        return Matrix((
-            (x.x, y.x, z.x, p_embed.x),
-            (x.y, y.y, z.y, p_embed.y),
-            (x.z, y.z, z.z, p_embed.z),
-            (0,   0,   0,   1.0),
-        ))
+        M = self._frame_rot.copy()
+        M.translation = point_world - self._embed_vec
+        return M
 
 # ---------------------------
 # Batch placement operator (existing)
@@ -1081,13 +1303,18 @@ class SNAP_OT_add_connectors(Operator):
                         "Mindestens 2 geschnittene Mesh-Teile auswählen.")
             return {'CANCELLED'}
 
-        created = place_connectors_between(
-            parts=sel,
-            axis=props.split_axis,
-            count=props.connectors_per_seam,
-            ctype=props.connector_type,
-            props=props
-        )
+        cache_unit_mm()
+        try:
+            created = place_connectors_between(
+                parts=sel,
+                axis=props.split_axis,
+                count=props.connectors_per_seam,
+                ctype=props.connector_type,
+                props=props,
+                op=self
+            )
+        finally:
+            clear_unit_mm_cache()
         report_user(self, 'INFO', f"{len(created)} connectors created.",
                     f"{len(created)} Verbinder erstellt.")
         return {'FINISHED'}
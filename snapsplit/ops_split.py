@@ -44,6 +44,9 @@ PREVIEW_MAT_NAME = "_SnapSplit_Preview_MAT"
 # Helpers: AABB / axes / eps / context / normals
 # ---------------------------
 
+# World unit axes (frozen, already normalized; do not modify)
+_WORLD_AXES = (Vector((1,0,0)).freeze(), Vector((0,1,0)).freeze(), Vector((0,0,1)).freeze())
+
 def axis_index_for(axis):
     """Return axis index 0/1/2 for axis string X/Y/Z."""
     return {"X": 0, "Y": 1, "Z": 2}[axis]
@@ -80,6 +83,15 @@ def _diag_eps(obj, k=1e-6, min_eps=1e-6):
     diag = (max_v - min_v).length
     return max(min_eps, diag * k)
 
+def _edge_midpoint_centroid(edges):
+    """Return the mean of the edge midpoints, accumulated in place (no temporary Vectors per edge)."""
+    acc = Vector((0.0, 0.0, 0.0))
+    for e in edges:
+        acc += e.verts[0].co
+        acc += e.verts[1].co
+    acc *= 0.5 / max(1, len(edges))
+    return acc
+
 def _ensure_object_mode():
     """Ensure Blender is in OBJECT mode (safe switch if needed)."""
     try:
@@ -311,14 +323,13 @@ def build_preview_matrix(obj, axis, pos):
     (size_t1, size_t2), (t1_idx, t2_idx), (min_v, max_v) = size_on_tangential_axes(obj, axis)
     size_t1 = max(size_t1, 1e-9); size_t2 = max(size_t2, 1e-9)
     ax = axis_index_for(axis); c = aabb_center(min_v, max_v)
-    world_axes = (Vector((1,0,0)), Vector((0,1,0)), Vector((0,0,1)))
-    z_dir = world_axes[ax].copy().normalized()
-    x_dir = world_axes[t1_idx].copy().normalized()
+    z_dir = _WORLD_AXES[ax]
+    x_dir = _WORLD_AXES[t1_idx]
     if abs(z_dir.dot(x_dir)) > 0.999:
-        x_dir = world_axes[(ax + 2) % 3].copy().normalized()
+        x_dir = _WORLD_AXES[(ax + 2) % 3]
     y_dir = z_dir.cross(x_dir)
     if y_dir.length_squared == 0.0:
-        x_dir = world_axes[(ax + 2) % 3].copy().normalized()
+        x_dir = _WORLD_AXES[(ax + 2) % 3]
         y_dir = z_dir.cross(x_dir)
     y_dir.normalize(); x_dir = y_dir.cross(z_dir); x_dir.normalize()
     R = Matrix(((x_dir.x, y_dir.x, z_dir.x, 0.0),
@@ -918,8 +929,7 @@ def cap_single_object_hollow_style(obj) -> bool:
 
     # Collect boundary edges orthogonal to split axis
     ax = axis_index_for(plane_axis)
-    axis_vecs = (Vector((1,0,0)), Vector((0,1,0)), Vector((0,0,1)))
-    split_no = axis_vecs[ax].normalized()
+    split_no = _WORLD_AXES[ax]
     eps_dir = 0.12
     cand = []
     for e in bm.edges:
@@ -999,8 +1009,7 @@ def cap_single_object_hollow_style(obj) -> bool:
             continue
 
         # Plane centroid and planarity filter
-        mids = [(0.5 * (e.verts[0].co + e.verts[1].co)) for e in edges_on_plane]
-        p_plane = sum(mids, Vector((0,0,0))) * (1.0 / max(1, len(mids)))
+        p_plane = _edge_midpoint_centroid(edges_on_plane)
         def max_dist_to_plane(loop):
             return max(abs((v.co - p_plane).dot(n_plane)) for e in loop for v in e.verts)
         comps = [c for c in comps if max_dist_to_plane(c) <= eps_plane_loop]
@@ -1304,8 +1313,7 @@ class SNAP_OT_cap_open_seams_now(Operator):
     def _cluster_split_ring_edges(self, obj, bm, plane_axis):
         """Cluster boundary edges into groups per split plane along the given axis."""
         ax = axis_index_for(plane_axis)
-        axis_vecs = (Vector((1,0,0)), Vector((0,1,0)), Vector((0,0,1)))
-        split_no = axis_vecs[ax].normalized()
+        split_no = _WORLD_AXES[ax]
 
         eps_plane = _diag_eps(obj, k=5e-6, min_eps=5e-7)
         eps_dir = 0.12
@@ -1416,7 +1424,7 @@ class SNAP_OT_cap_open_seams_now(Operator):
             return False
 
         ax = axis_index_for(plane_axis)
-        n_plane = (Vector((1,0,0)), Vector((0,1,0)), Vector((0,0,1)))[ax].normalized()
+        n_plane = _WORLD_AXES[ax]
         eps_plane_loop = _diag_eps(obj, k=8e-6, min_eps=8e-7)
 
         processed = 0
@@ -1473,8 +1481,7 @@ class SNAP_OT_cap_open_seams_now(Operator):
                 continue
 
             # Planarity filter
-            mids = [(0.5 * (e.verts[0].co + e.verts[1].co)) for e in edges_on_plane]
-            p_plane = sum(mids, Vector((0,0,0))) * (1.0 / max(1, len(mids)))
+            p_plane = _edge_midpoint_centroid(edges_on_plane)
 
             comps = [c for c in comps if max(abs((v.co - p_plane).dot(n_plane)) for e in c for v in e.verts) <= eps_plane_loop]
             if len(comps) < 2:
@@ -278,6 +278,26 @@ class SnapSplitProps(PropertyGroup):
         soft_max=2.0,
     )
 
+    # Boolean solver for connector unions/sockets
+    boolean_solver: EnumProperty(
+        name="Boolean Solver" if not _DE else "Boolean-Solver",
+        description=("Solver for connector Booleans. FAST is much quicker on pins/tenons; switch to EXACT if results are unstable (non-manifold or coincident geometry)"
+                     if not _DE else "Solver für Verbinder-Booleans. FAST ist bei Pins/Zapfen deutlich schneller; bei instabilen Ergebnissen (nicht-manifold oder deckungsgleiche Geometrie) auf EXACT umstellen"),
+        items=[
+            ("AUTO",
+             "Auto" if not _DE else "Automatisch",
+             "FAST for pins and plain tenons, EXACT for chamfered tenons"
+             if not _DE else "FAST für Pins und einfache Zapfen, EXACT für Zapfen mit Fase"),
+            ("FAST",
+             "Fast" if not _DE else "Schnell",
+             "Fast floating-point solver" if not _DE else "Schneller Gleitkomma-Solver"),
+            ("EXACT",
+             "Exact" if not _DE else "Exakt",
+             "Exact solver, slower but robust" if not _DE else "Exakter Solver, langsamer aber robust"),
+        ],
+        default="AUTO",
+    )
+
     # Insert depth
     pin_embed_pct: FloatProperty(
         name="Insert Depth (%)" if not _DE else "Einstecktiefe (%)",
@@ -182,6 +182,8 @@ class SNAP_PT_panel(Panel):
 
             gbox.prop(props, "add_chamfer_mm",
                       text=("Chamfer (mm)" if not _DE else "Fase (mm)"))
+            gbox.prop(props, "boolean_solver",
+                      text=("Boolean Solver" if not _DE else "Boolean-Solver"))
 
             # SNAP-specific (for SNAP_PIN and SNAP_TENON)
             if props.connector_type in {"SNAP_PIN", "SNAP_TENON"}:
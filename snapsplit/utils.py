@@ -19,6 +19,7 @@ You should have received a copy of the GNU General Public License
 along with this program; if not, see <https://www.gnu.org/licenses>.
 '''
 import bpy
+from bpy.app.handlers import persistent
 from mathutils import Vector
 
 def ensure_collection(name):
@@ -30,24 +31,38 @@ def ensure_collection(name):
     return coll
 
 def link_to_collection(obj, coll):
-    """Unlink object from its collections (safe) and link it to the target collection."""
-    for c in obj.users_collection:
+    """Move object into the target collection only (no-op if it is already linked there alone)."""
+    users = list(obj.users_collection)
+    if len(users) == 1 and users[0] == coll:
+        return
+    for c in users:
+        if c != coll:
+            try:
+                c.objects.unlink(obj)
+            except Exception:
+                pass
+    if coll not in users:
         try:
-            c.objects.unlink(obj)
+            coll.objects.link(obj)
         except Exception:
             pass
-    try:
-        coll.objects.link(obj)
-    except Exception:
-        pass
 
 def obj_world_bb(obj):
     """Return (min, max) of the object's world-space axis-aligned bounding box."""
-    mat = obj.matrix_world
-    coords = [mat @ Vector(corner) for corner in obj.bound_box]
-    min_v = Vector((min(c.x for c in coords), min(c.y for c in coords), min(c.z for c in coords)))
-    max_v = Vector((max(c.x for c in coords), max(c.y for c in coords), max(c.z for c in coords)))
-    return min_v, max_v
+    # Transform the local box as center + half-extent (Arvo): one affine transform for
+    # the center, |3x3| times the extent, instead of eight corner transforms.
+    bb = obj.bound_box
+    lmin = Vector(bb[0]); lmax = Vector(bb[6])
+    lc = (lmin + lmax) * 0.5
+    le = (lmax - lmin) * 0.5
+    M = obj.matrix_world
+    wc = M @ lc
+    we = Vector((
+        abs(M[0][0]) * le.x + abs(M[0][1]) * le.y + abs(M[0][2]) * le.z,
+        abs(M[1][0]) * le.x + abs(M[1][1]) * le.y + abs(M[1][2]) * le.z,
+        abs(M[2][0]) * le.x + abs(M[2][1]) * le.y + abs(M[2][2]) * le.z,
+    ))
+    return wc - we, wc + we
 
 # Units: keep compatibility with the working scene
 def unit_mm():
@@ -59,6 +74,24 @@ def unit_mm():
             return 1.0
     return 0.001
 
+# Per-operation snapshot of unit_mm(); set by operators, cleared when they finish
+_unit_mm_cache = {"v": None}
+
+def cache_unit_mm():
+    """Snapshot unit_mm() for the running operation and return it."""
+    v = unit_mm()
+    _unit_mm_cache["v"] = v
+    return v
+
+def clear_unit_mm_cache():
+    """Drop the unit_mm() snapshot so later calls read the scene again."""
+    _unit_mm_cache["v"] = None
+
+def unit_mm_cached():
+    """Return the unit_mm() snapshot of the running operation, or the live value if none is set."""
+    v = _unit_mm_cache["v"]
+    return unit_mm() if v is None else v
+
 def mm_to_scene(mm_value: float) -> float:
     """Convert a length in millimeters to scene units, honoring metric settings."""
     us = bpy.context.scene.unit_settings
@@ -86,12 +119,42 @@ def current_language():
     except Exception:
         return "en_US"
 
-def is_lang_de():
-    """Return True if the current UI language starts with 'de' (German)."""
+# Cached is_lang_de() result; invalidated via msgbus when the UI language preference changes
+_lang_cache = {"de": None}
+_lang_owner = object()
+
+def _invalidate_lang_cache(*_args):
+    """Drop the cached language flag (msgbus / load_post callback)."""
+    _lang_cache["de"] = None
+
+def _subscribe_lang_change():
+    """Subscribe to UI language changes so the cached flag is refreshed."""
     try:
-        return current_language().lower().startswith("de")
+        bpy.msgbus.subscribe_rna(
+            key=(bpy.types.PreferencesView, "language"),
+            owner=_lang_owner,
+            args=(),
+            notify=_invalidate_lang_cache,
+        )
     except Exception:
-        return False
+        pass
+
+@persistent
+def _on_load_post(*_args):
+    """Loading a file clears msgbus subscriptions; re-subscribe and drop the cache."""
+    _invalidate_lang_cache()
+    _subscribe_lang_change()
+
+def is_lang_de():
+    """Return True if the current UI language starts with 'de' (German)."""
+    v = _lang_cache["de"]
+    if v is None:
+        try:
+            v = current_language().lower().startswith("de")
+        except Exception:
+            v = False
+        _lang_cache["de"] = v
+    return v
 
 def report_user(self, level, msg_en, msg_de=None):
     """Report a localized message to the user, falling back to English; also print to console."""
@@ -104,9 +167,19 @@ def report_user(self, level, msg_en, msg_de=None):
     print(f"[SnapSplit][{level}] {text}")
 
 def register():
-    """Required add-on hook (no-op for utilities)."""
-    pass
+    """Required add-on hook; watches the UI language for the cached is_lang_de()."""
+    _invalidate_lang_cache()
+    _subscribe_lang_change()
+    if _on_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post)
 
 def unregister():
-    """Required add-on hook (no-op for utilities)."""
-    pass
+    """Required add-on hook; drops cached scene state and language watchers."""
+    clear_unit_mm_cache()
+    try:
+        bpy.msgbus.clear_by_owner(_lang_owner)
+    except Exception:
+        pass
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    _invalidate_lang_cache()